@@ -1,35 +1,12 @@
-from importlib import import_module
-import os
-
-import click
-import requests
-
-
-INPUT_URL = "https://adventofcode.com/2022/day/{day}/input"
-
-
-def get_input(day):
-    response = requests.get(
-        INPUT_URL.format(day=day), cookies={"session": os.environ["AOC_SESSION"]}
-    )
-    response.raise_for_status()
-    return response.text
-
-
-def format_output(output):
-    if isinstance(output, str) and "\n" in output:
-        return "\n" + output
-    return str(output)
-
-
-@click.command()
-@click.argument("day", type=int, required=True)
-def aoc(day):
-    module = import_module(f"aoc.day{day}")
-
-    data = get_input(day)
-
-    print(f"Part 1: {format_output(module.part1(data))}")
-
-    if hasattr(module, "part2"):
-        print(f"Part 2: {format_output(module.part2(data))}")
+# The command line interface and input handling live in submodules which are only imported on
+# first use, so that importing a day module (e.g. in a worker process) stays cheap.
+def __getattr__(name):
+    if name == "aoc":
+        from aoc.cli import aoc
+
+        return aoc
+    if name == "get_input":
+        from aoc.inputs import get_input
+
+        return get_input
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
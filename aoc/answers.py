@@ -0,0 +1,92 @@
+from hashlib import sha256
+import json
+import sqlite3
+import sys
+import time
+from types import ModuleType
+
+from aoc.inputs import cache_dir
+
+
+MAX_ENTRIES = 10000
+
+
+def source_hash(module):
+    """Digest of a day module's source, along with the source of any other `aoc` modules it uses
+    directly (e.g. shared parsing helpers), so that editing any of them invalidates its answers.
+    """
+    modules = {module.__name__: module}
+    for value in vars(module).values():
+        name = value.__name__ if isinstance(value, ModuleType) else getattr(
+            value, "__module__", None
+        )
+        if isinstance(name, str) and name.startswith("aoc.") and name in sys.modules:
+            modules.setdefault(name, sys.modules[name])
+
+    digest = sha256()
+    for name in sorted(modules):
+        with open(modules[name].__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def input_hash(data):
+    return sha256(data.encode()).hexdigest()
+
+
+class AnswerStore:
+    """SQLite-backed store of answers keyed by (module source hash, part, input hash). Answers
+    computed by an older version of a day's module are never returned, and are purged the next
+    time an answer for that day is stored. Beyond `max_entries`, the least recently used answers
+    are evicted.
+    """
+
+    def __init__(self, path=None, max_entries=MAX_ENTRIES):
+        path = path or cache_dir() / "answers.sqlite3"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS answers (
+                    day INTEGER NOT NULL,
+                    source TEXT NOT NULL,
+                    part TEXT NOT NULL,
+                    input TEXT NOT NULL,
+                    answer TEXT NOT NULL,
+                    used REAL NOT NULL,
+                    PRIMARY KEY (source, part, input)
+                )"""
+            )
+
+    def get(self, source, part, input_):
+        """Returns the stored answer, or `None` if there isn't one."""
+        key = (source, part, input_)
+        row = self.connection.execute(
+            "SELECT answer FROM answers WHERE source = ? AND part = ? AND input = ?", key
+        ).fetchone()
+        if row is None:
+            return None
+
+        with self.connection:
+            self.connection.execute(
+                "UPDATE answers SET used = ? WHERE source = ? AND part = ? AND input = ?",
+                (time.time(), *key),
+            )
+        return json.loads(row[0])
+
+    def put(self, day, source, part, input_, answer):
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)",
+                (day, source, part, input_, json.dumps(answer), time.time()),
+            )
+            self.connection.execute(
+                "DELETE FROM answers WHERE day = ? AND source != ?", (day, source)
+            )
+            self.connection.execute(
+                """DELETE FROM answers WHERE rowid IN (
+                    SELECT rowid FROM answers ORDER BY used DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.max_entries,),
+            )
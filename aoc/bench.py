@@ -0,0 +1,165 @@
+from collections import defaultdict
+from functools import partial
+from math import ceil, log
+from statistics import fmean, median
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from aoc.gen import generate
+from aoc.runner import PARTS, load_day, prepare
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty collection of values."""
+    values = sorted(values)
+    return values[max(ceil(fraction * len(values)) - 1, 0)]
+
+
+def summarize(times):
+    return {
+        "min": min(times),
+        "median": median(times),
+        "p95": percentile(times, 0.95),
+    }
+
+
+def timings(func, data, repeat, setup=None):
+    """Times repeated calls of `func`. If given, `setup` is applied to the data before every call,
+    outside the timed region.
+    """
+    times = list()
+    for _ in range(repeat):
+        arg = setup(data) if setup else data
+        start = time.perf_counter()
+        func(arg)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def time_part(func, data, repeat=5, warmup=1, setup=None):
+    """Times repeated calls of a solver, with an optional untimed `setup` before each (see
+    `timings`). Peak memory is measured on a separate call, since tracing allocations slows
+    everything down and would skew the timings.
+    """
+    for _ in range(warmup):
+        func(setup(data) if setup else data)
+
+    times = timings(func, data, repeat, setup)
+
+    arg = setup(data) if setup else data
+    tracemalloc.start()
+    try:
+        func(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {**summarize(times), "peak_memory": peak}
+
+
+def run_bench(days, get_data, repeat=5, warmup=1, progress=None):
+    """Benchmarks every part of the given days, keyed by `dayN.partM`, along with the shared
+    `dayN.prepare` stage of days which have one. `get_data` maps a day to its input.
+
+    Parts are given a freshly prepared input on every run (prepared outside the timed region),
+    since some days cache work on the prepared value, which would otherwise leak between runs and
+    from one part into the next.
+    """
+    results = dict()
+    for day in days:
+        module = load_day(day)
+        data = get_data(day)
+        if hasattr(module, "prepare"):
+            if progress:
+                progress(f"day{day}.prepare")
+            results[f"day{day}.prepare"] = time_part(
+                module.prepare, data, repeat, warmup
+            )
+        for part in PARTS:
+            if not hasattr(module, part):
+                continue
+            if progress:
+                progress(f"day{day}.{part}")
+            results[f"day{day}.{part}"] = time_part(
+                getattr(module, part), data, repeat, warmup, partial(prepare, module)
+            )
+    return results
+
+
+def import_time(module):
+    """Measures the cumulative time (in seconds) to import a module in a fresh interpreter, as
+    reported by `python -X importtime`.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines look like "import time:  <self us> | <cumulative us> | <module>", where nested
+    # imports are indented
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1e6
+    raise ValueError(f"No import time reported for {module}")
+
+
+def bench_imports(modules, repeat=5, progress=None):
+    """Benchmarks the cold-start import cost of the given modules, keyed by `import:<module>`."""
+    results = dict()
+    for module in modules:
+        if progress:
+            progress(f"import:{module}")
+        results[f"import:{module}"] = summarize(
+            [import_time(module) for _ in range(repeat)]
+        )
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Finds the parts whose median time regressed by more than the given fraction against a
+    baseline, as (name, baseline median, current median) tuples. Parts missing from either side
+    are ignored.
+    """
+    return [
+        (name, baseline[name]["median"], result["median"])
+        for name, result in results.items()
+        if name in baseline
+        and result["median"] > baseline[name]["median"] * (1 + threshold)
+    ]
+
+
+def fit_exponent(sizes, times):
+    """Least-squares fit of `time ~ size^k` on a log-log scale, returning the empirical exponent
+    `k`.
+    """
+    xs = [log(size) for size in sizes]
+    # guard against timer resolution on tiny inputs
+    ys = [log(max(t, 1e-9)) for t in times]
+    mean_x, mean_y = fmean(xs), fmean(ys)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum(
+        (x - mean_x) ** 2 for x in xs
+    )
+
+
+def run_scale(day, sizes, repeat=3, seed=0, progress=None):
+    """Times each stage of a day (its prepare stage, if any, and each part) on generated inputs
+    of the given sizes. Returns the best time per size for each stage. As in `run_bench`, parts
+    get a freshly prepared input on every run.
+    """
+    module = load_day(day)
+    results = defaultdict(list)
+    for size in sizes:
+        if progress:
+            progress(f"day{day} size {size}")
+        data = generate(day, size, seed)
+        if hasattr(module, "prepare"):
+            results["prepare"].append(min(timings(module.prepare, data, repeat)))
+        for part in PARTS:
+            if hasattr(module, part):
+                times = timings(getattr(module, part), data, repeat, partial(prepare, module))
+                results[part].append(min(times))
+    return dict(results)
@@ -0,0 +1,414 @@
+import json
+from pathlib import Path
+import time
+
+import click
+
+from aoc.inputs import MissingSessionError, fetch_inputs, get_input
+from aoc.runner import PARTS, load_day, prepare, run_batch, run_parallel
+
+
+def format_output(output):
+    if isinstance(output, str) and "\n" in output:
+        return "\n" + output
+    return str(output)
+
+
+def parse_days(spec):
+    """Parses a day specification such as `5`, `1-25`, `1,3,10-12` or `all`."""
+    if spec == "all":
+        return list(range(1, 26))
+
+    days = list()
+    try:
+        for token in spec.split(","):
+            start, _, end = token.partition("-")
+            days.extend(range(int(start), int(end or start) + 1))
+    except ValueError:
+        raise click.BadParameter(f"invalid day specification: {spec!r}")
+
+    invalid = sorted(set(day for day in days if not 1 <= day <= 25))
+    if invalid:
+        raise click.BadParameter(f"days must be between 1 and 25, not {invalid}")
+    return days
+
+
+def load_input(day, offline=False, input_file=None):
+    if input_file:
+        return input_file.read()
+
+    try:
+        return get_input(day, offline=offline)
+    except (FileNotFoundError, MissingSessionError) as e:
+        raise click.ClickException(str(e))
+
+
+class DayGroup(click.Group):
+    """Dispatches `aoc DAY ...` to the `run` command, alongside the named subcommands."""
+
+    def resolve_command(self, ctx, args):
+        if args and args[0] not in self.commands and not args[0].startswith("-"):
+            args = ["run", *args]
+        return super().resolve_command(ctx, args)
+
+
+@click.group(cls=DayGroup)
+def aoc():
+    pass
+
+
+@aoc.command()
+@click.argument("days", required=True)
+@click.option("--offline", is_flag=True, help="Only read the input from the local cache.")
+@click.option(
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    help="Read the input from a file ('-' for stdin) instead of the cache or network.",
+)
+@click.option(
+    "--workers",
+    type=int,
+    help="Worker processes when solving several days (defaults to the CPU count).",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Report cProfile and tracemalloc results for each stage on stderr.",
+)
+@click.option(
+    "--profile-top",
+    default=20,
+    show_default=True,
+    help="Functions and allocation sites to list per stage when profiling.",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False),
+    help="Also dump pstats files for each stage to this directory when profiling.",
+)
+@click.option(
+    "--metrics",
+    "show_metrics",
+    is_flag=True,
+    help="Report the solvers' search counters for each stage on stderr.",
+)
+@click.option(
+    "--no-cache", is_flag=True, help="Always solve, ignoring previously stored answers."
+)
+@click.option(
+    "--via-daemon", is_flag=True, help="Have a running `aoc serve` process solve it."
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="The daemon's socket (defaults to one in the cache directory).",
+)
+def run(
+    days,
+    offline,
+    input_file,
+    workers,
+    profile,
+    profile_top,
+    profile_dir,
+    show_metrics,
+    no_cache,
+    via_daemon,
+    socket_path,
+):
+    """Solve the puzzles for a day, or for several days (e.g. `1-25` or `all`) in parallel."""
+    days = parse_days(days)
+    if len(days) > 1:
+        if input_file or profile or show_metrics or via_daemon:
+            raise click.UsageError(
+                "--input, --profile, --metrics and --via-daemon need a single day"
+            )
+        run_many(days, offline, workers)
+        return
+
+    day = days[0]
+
+    if via_daemon:
+        if profile or show_metrics:
+            raise click.UsageError("--profile and --metrics can't be used with --via-daemon")
+
+        from aoc.daemon import request
+
+        data = input_file.read() if input_file else None
+        try:
+            answers = request(day, data, offline, socket_path, store=not no_cache)
+        except (OSError, RuntimeError) as e:
+            raise click.ClickException(str(e))
+        for part, answer in answers.items():
+            print(f"Part {part[-1]}: {format_output(answer)}")
+        return
+
+    module = load_day(day)
+
+    data = load_input(day, offline, input_file)
+
+    if profile or show_metrics:
+        run_instrumented(day, module, data, profile, profile_top, profile_dir, show_metrics)
+        return
+
+    for part, answer in solve(day, module, data, store=not no_cache):
+        print(f"Part {part[-1]}: {format_output(answer)}")
+
+
+def solve(day, module, data, store=True):
+    """Yields (part, answer) for each of the day's parts. Unless disabled, stored answers are
+    used where available, and the input is only prepared if something needs solving.
+    """
+    if store:
+        from aoc.answers import AnswerStore, input_hash, source_hash
+
+        store = AnswerStore()
+        source, input_ = source_hash(module), input_hash(data)
+
+    prepared = None
+    for part in PARTS:
+        if not hasattr(module, part):
+            continue
+
+        answer = store.get(source, part, input_) if store else None
+        if answer is None:
+            if prepared is None:
+                prepared = prepare(module, data)
+            answer = getattr(module, part)(prepared)
+            if store:
+                store.put(day, source, part, input_, answer)
+
+        yield part, answer
+
+
+def run_stage(name, func, arg):
+    return func(arg)
+
+
+def profiled(day, top_n, dump_dir):
+    """Returns a stage runner which profiles each stage, reporting on stderr. It calls the stage
+    directly, so that it's always innermost and nothing else shows up in the profile.
+    """
+    from aoc.profile import profile_stage
+
+    def run_profiled(name, func, arg):
+        result, report = profile_stage(f"day{day}.{name}", func, arg, top_n, dump_dir)
+        click.echo(report, err=True)
+        return result
+
+    return run_profiled
+
+
+def with_metrics(day, run_inner):
+    """Wraps a stage runner to report the solvers' metrics for each stage on stderr."""
+    from aoc import metrics
+
+    metrics.enable()
+
+    def run_with_metrics(name, func, arg):
+        metrics.reset()
+        result = run_inner(name, func, arg)
+        click.echo(f"=== day{day}.{name} metrics", err=True)
+        for counter, value in sorted(metrics.counters.items()):
+            click.echo(f"  {counter}: {value}", err=True)
+        if not metrics.counters:
+            click.echo("  (no metrics recorded)", err=True)
+        return result
+
+    return run_with_metrics
+
+
+def run_instrumented(day, module, data, profile, top_n, dump_dir, show_metrics):
+    """Runs each stage (prepare, if the day has it, and every part) separately, reporting the
+    profile and/or the solvers' metrics for each on stderr.
+    """
+    stage = run_stage
+    if profile:
+        stage = profiled(day, top_n, dump_dir)
+    if show_metrics:
+        stage = with_metrics(day, stage)
+
+    # the split between parsing and solving is only visible for days with a prepare stage
+    if hasattr(module, "prepare"):
+        data = stage("prepare", module.prepare, data)
+
+    for part in PARTS:
+        if hasattr(module, part):
+            print(f"Part {part[-1]}: {format_output(stage(part, getattr(module, part), data))}")
+
+
+def run_many(days, offline, workers):
+    inputs = {day: load_input(day, offline) for day in days}
+
+    start = time.perf_counter()
+    total = 0
+    for day, part, answer, elapsed in run_parallel(inputs, workers):
+        total += elapsed
+        print(f"Day {day} part {part[-1]}: {format_output(answer)} ({elapsed:.3f}s)")
+
+    print(f"Total: {time.perf_counter() - start:.3f}s wall, {total:.3f}s across parts")
+
+
+@aoc.command()
+@click.argument("day", type=int)
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--workers", type=int, help="Worker processes (defaults to the CPU count)."
+)
+@click.option(
+    "--chunksize", default=16, show_default=True, help="Inputs sent to a worker at a time."
+)
+@click.option(
+    "--output", type=click.File("w"), default="-", help="Where to write the JSONL results."
+)
+def batch(day, directory, workers, chunksize, output):
+    """Solve a day for every input file in a directory."""
+    paths = sorted(path for path in Path(directory).iterdir() if path.is_file())
+
+    start = time.perf_counter()
+    failures = 0
+    for record in run_batch(day, paths, workers, chunksize):
+        failures += "error" in record
+        output.write(json.dumps(record, default=str) + "\n")
+    elapsed = time.perf_counter() - start
+
+    click.echo(
+        f"{len(paths)} inputs in {elapsed:.3f}s "
+        f"({len(paths) / elapsed:.1f} inputs/sec), {failures} failed",
+        err=True,
+    )
+
+
+@aoc.command()
+@click.argument("days", default="all")
+@click.option(
+    "--concurrency", default=4, show_default=True, help="Downloads in flight at once."
+)
+@click.option(
+    "--retries", default=3, show_default=True, help="Retries per input on transient errors."
+)
+def fetch(days, concurrency, retries):
+    """Download and cache any missing inputs for the given days (e.g. `1-25`)."""
+    try:
+        fetched, errors = fetch_inputs(parse_days(days), concurrency, retries)
+    except MissingSessionError as e:
+        raise click.ClickException(str(e))
+
+    click.echo(f"Fetched {len(fetched)} input(s)", err=True)
+    for day, error in sorted(errors.items()):
+        click.echo(f"Day {day}: {error}", err=True)
+    if errors:
+        raise click.ClickException(f"{len(errors)} input(s) could not be fetched")
+
+
+@aoc.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Where to listen (defaults to a socket in the cache directory).",
+)
+@click.option(
+    "--max-memory",
+    default=256,
+    show_default=True,
+    help="Megabytes of prepared inputs to keep around.",
+)
+def serve(socket_path, max_memory):
+    """Keep day modules and prepared inputs warm for `aoc DAY --via-daemon`."""
+    from aoc.daemon import serve
+
+    serve(socket_path, max_memory * 1024 * 1024)
+
+
+@aoc.command()
+@click.argument("days", default="all")
+@click.option("--repeat", default=5, show_default=True, help="Timed runs per part.")
+@click.option("--warmup", default=1, show_default=True, help="Untimed runs per part.")
+@click.option("--offline", is_flag=True, help="Only read inputs from the local cache.")
+@click.option(
+    "--imports",
+    is_flag=True,
+    help="Time cold imports of the CLI and the days' modules instead of solving.",
+)
+@click.option(
+    "--output", type=click.File("w"), default="-", help="Where to write the JSON report."
+)
+@click.option(
+    "--baseline", type=click.File("r"), help="A previous report to compare against."
+)
+@click.option(
+    "--threshold",
+    default=0.1,
+    show_default=True,
+    help="Allowed fractional slowdown of a part's median time against the baseline.",
+)
+def bench(days, repeat, warmup, offline, imports, output, baseline, threshold):
+    """Time the solvers for the given days (e.g. `1-25`)."""
+    from aoc.bench import bench_imports, compare, run_bench
+
+    progress = lambda name: click.echo(f"Benchmarking {name}", err=True)
+    if imports:
+        modules = ["aoc", "aoc.cli"] + [f"aoc.day{day}" for day in parse_days(days)]
+        results = bench_imports(modules, repeat, progress)
+    else:
+        results = run_bench(
+            parse_days(days), lambda day: load_input(day, offline), repeat, warmup, progress
+        )
+    json.dump(results, output, indent=2)
+    output.write("\n")
+
+    if baseline:
+        regressions = compare(results, json.load(baseline), threshold)
+        for name, before, after in regressions:
+            click.echo(f"{name}: {before:.4f}s -> {after:.4f}s", err=True)
+        if regressions:
+            raise click.ClickException(f"{len(regressions)} part(s) regressed")
+
+
+@aoc.command()
+@click.argument("day", type=int)
+@click.option(
+    "--sizes",
+    default="100,200,400,800",
+    show_default=True,
+    help="Comma-separated generator sizes (what the size controls depends on the day).",
+)
+@click.option("--repeat", default=3, show_default=True, help="Timed runs per size.")
+@click.option("--seed", default=0, show_default=True, help="Seed for the input generator.")
+@click.option(
+    "--max-exponent",
+    type=float,
+    help="Fail if any stage scales worse than size to this power.",
+)
+def scale(day, sizes, repeat, seed, max_exponent):
+    """Measure how a day's solver scales on generated inputs."""
+    from aoc.bench import fit_exponent, run_scale
+
+    sizes = [int(size) for size in sizes.split(",")]
+    results = run_scale(
+        day,
+        sizes,
+        repeat,
+        seed,
+        progress=lambda name: click.echo(f"Timing {name}", err=True),
+    )
+
+    print("size".rjust(10) + "".join(stage.rjust(12) for stage in results))
+    for idx, size in enumerate(sizes):
+        print(
+            str(size).rjust(10)
+            + "".join(f"{times[idx]:12.5f}" for times in results.values())
+        )
+
+    exponents = {stage: fit_exponent(sizes, times) for stage, times in results.items()}
+    print("exponent".rjust(10) + "".join(f"{k:12.2f}" for k in exponents.values()))
+
+    if max_exponent is not None:
+        too_slow = [stage for stage, k in exponents.items() if k > max_exponent]
+        if too_slow:
+            raise click.ClickException(
+                f"{', '.join(too_slow)} scaled worse than size^{max_exponent}"
+            )
@@ -0,0 +1,161 @@
+from collections import OrderedDict
+import gc
+from importlib import reload
+import json
+import os
+import socket
+import socketserver
+import sys
+from types import ModuleType
+
+from aoc.answers import AnswerStore, input_hash, source_hash
+from aoc.inputs import cache_dir, get_input
+from aoc.runner import PARTS, load_day, prepare
+
+
+MAX_PREPARED_BYTES = 256 * 1024 * 1024
+
+
+def socket_path():
+    return cache_dir() / "aoc.sock"
+
+
+def deep_sizeof(obj):
+    """Estimates the memory held by an object and everything it references, not counting modules,
+    classes or module-level globals, which are shared rather than owned.
+    """
+    shared = {id(vars(module)) for module in list(sys.modules.values()) if module}
+    seen = set()
+    size = 0
+    to_visit = [obj]
+    while to_visit:
+        obj = to_visit.pop()
+        if id(obj) in seen or id(obj) in shared or isinstance(obj, (type, ModuleType)):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        to_visit.extend(gc.get_referents(obj))
+    return size
+
+
+class Daemon:
+    """Long-lived solver state: imported day modules, reloaded whenever their source changes, and
+    prepared inputs, kept in least-recently-used order and evicted once their estimated size
+    exceeds `max_bytes`. Answers are looked up in and added to the answer `store` (if given), just
+    like `aoc DAY` does, so only inputs that have never been solved need any solving.
+    """
+
+    def __init__(self, max_bytes=MAX_PREPARED_BYTES, store=None):
+        self.max_bytes = max_bytes
+        self.store = store
+        self.modules = dict()
+        self.sources = dict()
+        self.prepared = OrderedDict()
+
+    def module(self, day):
+        module, mtime = self.modules.get(day) or (load_day(day), None)
+        current_mtime = os.stat(module.__file__).st_mtime
+        if mtime is not None and current_mtime != mtime:
+            module = reload(module)
+            # anything prepared by the old code is stale
+            for key in [key for key in self.prepared if key[0] == day]:
+                del self.prepared[key]
+        if mtime != current_mtime:
+            # hashed as loaded, so stored answers always match the code that's actually running
+            self.sources[day] = source_hash(module)
+        self.modules[day] = module, current_mtime
+        return module
+
+    def solve(self, day, data, use_store=True):
+        module = self.module(day)
+        source, input_ = self.sources[day], input_hash(data)
+        store = self.store if use_store else None
+
+        answers = dict()
+        for part in PARTS:
+            if not hasattr(module, part):
+                continue
+            answer = store.get(source, part, input_) if store else None
+            if answer is not None:
+                answers[part] = answer
+
+        missing = [part for part in PARTS if hasattr(module, part) and part not in answers]
+        if missing:
+            answers.update(self.solve_parts(day, module, data, input_, missing))
+            if store:
+                for part in missing:
+                    store.put(day, source, part, input_, answers[part])
+
+        return {part: answers[part] for part in PARTS if part in answers}
+
+    def solve_parts(self, day, module, data, input_, parts):
+        key = (day, input_)
+        if key in self.prepared:
+            self.prepared.move_to_end(key)
+            prepared, _ = self.prepared[key]
+        else:
+            prepared = prepare(module, data)
+
+        answers = {part: getattr(module, part)(prepared) for part in parts}
+
+        # measured after solving, since some days keep filling caches on the prepared value
+        self.prepared[key] = prepared, deep_sizeof(prepared)
+        while sum(size for _, size in self.prepared.values()) > self.max_bytes:
+            self.prepared.popitem(last=False)
+
+        return answers
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Handles one request per connection: a JSON line with the `day` and optionally the input
+    `data` (otherwise it's loaded like `aoc DAY` would, honouring `offline`), and whether to use
+    the answer `store`. Responds with a JSON line holding either the `answers` or an `error`.
+    """
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            day = request["day"]
+            # fail fast on unknown days, before fetching anything
+            self.server.daemon.module(day)
+            data = request.get("data")
+            if data is None:
+                data = get_input(day, offline=request.get("offline", False))
+            answers = self.server.daemon.solve(day, data, request.get("store", True))
+            response = {"answers": answers}
+        except Exception as e:
+            response = {"error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+
+
+class Server(socketserver.UnixStreamServer):
+    def __init__(self, path, daemon):
+        self.daemon = daemon
+        # a stale socket file is left behind if a previous server was killed
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(str(path), Handler)
+
+
+def serve(path=None, max_bytes=MAX_PREPARED_BYTES):
+    path = path or socket_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with Server(path, Daemon(max_bytes, AnswerStore())) as server:
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(path)
+
+
+def request(day, data=None, offline=False, path=None, store=True):
+    """Asks a running daemon to solve a day, returning the answers by part."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(path or socket_path()))
+        message = {"day": day, "data": data, "offline": offline, "store": store}
+        client.sendall(json.dumps(message).encode() + b"\n")
+        with client.makefile("rb") as f:
+            response = json.loads(f.readline())
+
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response["answers"]
@@ -1,16 +1,49 @@
-def elf_totals(data):
-    total = 0
-    for line in data.split("\n"):
+from heapq import nlargest
+from io import BytesIO, StringIO
+
+
+def lines(source):
+    """Generates the lines of the input, which may be a string, bytes or anything with a
+    `readline` method (an open file in text or binary mode, or an mmap), so that large inputs can
+    be streamed rather than read into memory all at once.
+    """
+    if isinstance(source, str):
+        source = StringIO(source)
+    elif isinstance(source, (bytes, bytearray)):
+        source = BytesIO(source)
+
+    while True:
+        line = source.readline()
         if not line:
-            yield total
-            total = 0
+            return
+        yield line
+
+
+def elf_totals(source):
+    total = None
+    for line in lines(source):
+        line = line.strip()
+        if not line:
+            if total is not None:
+                yield total
+            total = None
             continue
-        total += int(line)
+        total = (total or 0) + int(line)
+
+    # the last elf's items are only followed by a blank line if the input
+    # happens to end with one
+    if total is not None:
+        yield total
+
+
+def top_k(source, k):
+    """The `k` largest elf totals, largest first. Only `k` totals are held in memory at once."""
+    return nlargest(k, elf_totals(source))
 
 
 def part1(data):
-    return max(elf_totals(data))
+    return top_k(data, 1)[0]
 
 
 def part2(data):
-    return sum(sorted(elf_totals(data))[-3:])
+    return sum(top_k(data, 3))
@@ -1,27 +1,60 @@
-from itertools import count, islice
+from array import array
+from itertools import accumulate, cycle
+from operator import sub
 
 
-def get_signals(data):
-    x = 1
-    counter = count(start=1)
-    for line in (line.strip() for line in data.split("\n")):
-        if line == "noop":
-            yield next(counter), x
-        elif line.startswith("addx"):
-            yield next(counter), x
-            yield next(counter), x
-            x += int(line[5:])
+# the number of cycles each instruction takes, and how its arguments give the change to the X
+# register once it completes (None for instructions which don't change it)
+INSTRUCTIONS = {
+    "noop": (1, None),
+    "addx": (2, int),
+}
 
+WIDTH = 40
 
-def part1(data):
-    return sum(
-        cycle * signal for cycle, signal in islice(get_signals(data), 19, None, 40)
-    )
 
+def compile_trace(data, instructions=INSTRUCTIONS):
+    """Runs the program once, returning the value of the X register during every cycle (cycle 1 is
+    at index 0). The change made by each cycle is recorded in a delta array, and the register values
+    are its cumulative sum, so the program is only parsed once however it's sampled afterwards.
+    """
+    deltas = array("q")
+    for line in data.split("\n"):
+        if not line.strip():
+            continue
+        name, *args = line.split()
+        cycles, effect = instructions[name]
+        deltas.extend(bytes(cycles - 1))
+        deltas.append(effect(*args) if effect else 0)
+    if not deltas:
+        return deltas
+    # the last delta only takes effect after the program has finished
+    return array("q", accumulate(deltas[:-1], initial=1))
 
-def part2(data):
-    return "".join(
-        ("#" if abs((cycle - 1) % 40 - signal) <= 1 else ".")
-        + ("" if cycle % 40 else "\n")
-        for cycle, signal in get_signals(data)
-    )
+
+def signal_strength(trace, cycles):
+    """The sum of the signal strengths (cycle number times X) during the given cycles."""
+    return sum(cycle_ * trace[cycle_ - 1] for cycle_ in cycles)
+
+
+def raster(trace, width=WIDTH):
+    """Draws the CRT, one pixel per cycle: lit if the sprite centered on X covers the column being
+    drawn.
+    """
+    offsets = map(sub, cycle(range(width)), trace)
+    pixels = "".join(["#" if -1 <= offset <= 1 else "." for offset in offsets])
+    rows = [pixels[start : start + width] for start in range(0, len(pixels), width)]
+    # only complete rows end with a newline
+    return "\n".join(rows) + ("\n" if rows and len(rows[-1]) == width else "")
+
+
+def prepare(data):
+    return compile_trace(data)
+
+
+def part1(trace):
+    return signal_strength(trace, range(20, len(trace) + 1, WIDTH))
+
+
+def part2(trace):
+    return raster(trace)
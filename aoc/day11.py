@@ -1,3 +1,8 @@
+from collections import Counter
+from functools import partial
+from itertools import chain
+from math import prod
+from operator import add, mul
 import re
 
 
@@ -11,126 +16,82 @@ PATTERN = re.compile(
 )
 
 
-class Item:
-    def __init__(self, value, _):
-        self.value = value
-
-    def add(self, operand):
-        self.value += operand
-
-    def multiply(self, operand):
-        self.value *= operand
-
-    def square(self):
-        self.value **= 2
-
-    def is_divisible(self, divisor):
-        return self.value % divisor == 0
-
-    def reduce_worry(self, worry_factor):
-        self.value //= worry_factor
-
-
-class BigItem:
-    """Separate class to efficiently handle operations on large item values. By inspection of the
-    monkey data, all monkeys are testing whether the item is divisible by a _prime_ divisor. Using
-    that information, the approach here is to maintain the `value (mod p)` value, which is smaller
-    than p, for each potential prime divisor (p). Modular arithmetic is "compatible" with normal
-    addition and multiplication, so this effectively is maintaining `operation(value) % p` for those
-    two operations.
-    """
-
-    def __init__(self, value, primes):
-        self.values = {prime: value % prime for prime in primes}
-
-    def add(self, operand):
-        self.values = {
-            prime: (value + operand) % prime for prime, value in self.values.items()
-        }
-
-    def multiply(self, operand):
-        self.values = {
-            prime: (value * operand) % prime for prime, value in self.values.items()
-        }
-
-    def square(self):
-        self.values = {
-            prime: (value * value) % prime for prime, value in self.values.items()
-        }
-
-    def is_divisible(self, divisor):
-        return self.values[divisor] == 0
-
-    def reduce_worry(self, worry_factor):
-        """The floor division is more complicated and we don't need it if we're using big items, so
-        let's skip it.
-        """
-        if worry_factor != 1:
-            raise NotImplementedError("Can't reduce worry on a BigItem")
-
-
 class Monkey:
-    # class attribute to maintain a list of all observed divisors
-    all_divisors = set()
-
-    def __init__(
-        self, item_string, operation, divisor, throw_true, throw_false, worry_factor
-    ):
-        self.raw_items = item_string
+    def __init__(self, item_string, operation, divisor, throw_true, throw_false):
+        self.items = [int(x.strip()) for x in item_string.split(",")]
 
         if operation == "old * old":
-            self.operate = lambda item: item.square()
+            self.operate = lambda old: old * old
         elif operation.startswith("old + "):
-            self.operate = lambda item: item.add(int(operation[6:]))
+            self.operate = partial(add, int(operation[6:]))
         elif operation.startswith("old * "):
-            self.operate = lambda item: item.multiply(int(operation[6:]))
+            self.operate = partial(mul, int(operation[6:]))
 
         self.divisor = int(divisor)
-        self.all_divisors.add(self.divisor)
-
         self.throw_true = int(throw_true)
         self.throw_false = int(throw_false)
-        self.worry_factor = worry_factor
-        self.n = 0
-
-    def setup_items(self):
-        """This has to be invoked after all monkeys have been created so that we have the full set
-        of divisors available.
-        """
-        item_class = Item if self.worry_factor > 1 else BigItem
-        self.items = [
-            item_class(item_value, self.all_divisors)
-            for item_value in (int(x.strip()) for x in self.raw_items.split(","))
-        ]
-
-    def run(self, monkeys):
-        while self.items:
-            item = self.items.pop(0)
-            self.operate(item)
-            item.reduce_worry(self.worry_factor)
-
-            recipient = monkeys[
-                self.throw_true if item.is_divisible(self.divisor) else self.throw_false
-            ]
-            recipient.items.append(item)
-
-            self.n += 1
-
-
-def parse_monkeys(data, worry_factor):
-    monkeys = [Monkey(*groups, worry_factor) for groups in PATTERN.findall(data)]
-    for monkey in monkeys:
-        monkey.setup_items()
-    return monkeys
-
-
-def run(data, worry_factor, iterations):
-    monkeys = parse_monkeys(data, worry_factor)
-    for _ in range(iterations):
-        for monkey in monkeys:
-            monkey.run(monkeys)
-    counts = sorted((monkey.n for monkey in monkeys), reverse=True)
-    return counts[0] * counts[1]
+
+    def target(self, value):
+        return self.throw_true if value % self.divisor == 0 else self.throw_false
+
+
+def parse_monkeys(data):
+    return [Monkey(*groups) for groups in PATTERN.findall(data)]
+
+
+def item_inspections(monkeys, monkey, value, worry_factor, modulus, rounds):
+    """Counts how many times each monkey inspects a single item over the given number of rounds.
+
+    Items never affect each other, so each one can be followed on its own. Its state at the start
+    of a round is the monkey holding it and its worry level, which (without worry reduction) only
+    matters modulo the product of all the divisors. Once a state repeats, every later round just
+    repeats the cycle, so the remaining rounds are counted by multiplying rather than simulating.
+    """
+    seen = dict()
+    history = list()  # the monkeys which inspected the item in each round
+    for round_ in range(rounds):
+        state = (monkey, value)
+        if state in seen:
+            break
+        seen[state] = round_
+
+        inspected = list()
+        # the item keeps moving within the round while it's thrown to monkeys whose turn is later
+        while True:
+            inspected.append(monkey)
+            value = monkeys[monkey].operate(value) // worry_factor
+            if modulus:
+                value %= modulus
+            target = monkeys[monkey].target(value)
+            thrown_back = target < monkey
+            monkey = target
+            if thrown_back:
+                break
+        history.append(inspected)
+    else:
+        return Counter(chain.from_iterable(history))
+
+    cycle_start = seen[state]
+    cycle = history[cycle_start:]
+    n_cycles, remainder = divmod(rounds - cycle_start, len(cycle))
+    counts = Counter(chain.from_iterable(history[:cycle_start] + cycle[:remainder]))
+    for monkey, count in Counter(chain.from_iterable(cycle)).items():
+        counts[monkey] += count * n_cycles
+    return counts
+
+
+def run(data, worry_factor, rounds):
+    monkeys = parse_monkeys(data)
+    # worry levels can only be kept modulo the divisors if they're never divided
+    modulus = prod(monkey.divisor for monkey in monkeys) if worry_factor == 1 else None
+
+    counts = Counter()
+    for idx, monkey in enumerate(monkeys):
+        for value in monkey.items:
+            counts += item_inspections(monkeys, idx, value, worry_factor, modulus, rounds)
+
+    top = sorted(counts.values(), reverse=True)
+    return top[0] * top[1]
 
 
 def part1(data):
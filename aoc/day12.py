@@ -1,62 +1,55 @@
-from itertools import product
+from collections import deque
 from string import ascii_lowercase
 
+from aoc import metrics
+from aoc.grid import Grid
 
-HEIGHTS = {char: height for height, char in enumerate(ascii_lowercase)}
-HEIGHTS["S"] = 0
-HEIGHTS["E"] = 25
+
+HEIGHTS = bytes.maketrans(
+    ascii_lowercase.encode() + b"SE", bytes(range(26)) + bytes((0, 25))
+)
 
 
 def find(map_, start_char, target_char, reverse=False):
-    width = len(map_)
-    height = len(map_[0])
-
-    start = next(
-        (i, j)
-        for i, row in enumerate(map_)
-        for j, char in enumerate(row)
-        if char == start_char
-    )
-
-    def get_neighbors(pos):
-        i, j = pos
-        candidates = [
-            (i + 1, j),
-            (i - 1, j),
-            (i, j + 1),
-            (i, j - 1),
-        ]
-        return [(i, j) for i, j in candidates if 0 <= i < width and 0 <= j < height]
+    heights = map_.cells.translate(HEIGHTS)
+    start = map_.cells.index(ord(start_char))
+    target = ord(target_char)
+    record = metrics.recorder()
 
     def valid_heights(site, neighbor):
         if reverse:
             site, neighbor = neighbor, site
-        return (
-            HEIGHTS[map_[site[0]][site[1]]] + 1
-            >= HEIGHTS[map_[neighbor[0]][neighbor[1]]]
-        )
-
-    # Dijkstra's algorithm
-    # width * height is just a value guaranteed to be larger than any result path length
-    distances = {pos: width * height for pos in product(range(width), range(height))}
+        return heights[site] + 1 >= heights[neighbor]
+
+    # every step costs the same, so a breadth-first search visits sites in order of distance
+    distances = [-1] * len(map_)
     distances[start] = 0
+    queue = deque([start])
+
+    while queue:
+        site = queue.popleft()
 
-    while distances:
-        site = min(distances, key=distances.__getitem__)
-        site_distance = distances.pop(site)
+        if record is not None:
+            record["nodes_expanded"] += 1
+            metrics.high_water(record, "queue_high_water", len(queue) + 1)
 
-        if map_[site[0]][site[1]] == target_char:
-            return site_distance
+        if map_.cells[site] == target:
+            return distances[site]
 
-        for neighbor in get_neighbors(site):
-            if not valid_heights(site, neighbor) or neighbor not in distances:
+        for neighbor in map_.neighbors(site):
+            if distances[neighbor] != -1 or not valid_heights(site, neighbor):
                 continue
-            distances[neighbor] = min(distances[neighbor], site_distance + 1)
+            distances[neighbor] = distances[site] + 1
+            queue.append(neighbor)
+
+
+def prepare(data):
+    return Grid.from_text(data)
 
 
-def part1(data):
-    return find(data.split(), "S", "E")
+def part1(map_):
+    return find(map_, "S", "E")
 
 
-def part2(data):
-    return find(data.split(), "E", "a", reverse=True)
+def part2(map_):
+    return find(map_, "E", "a", reverse=True)
@@ -33,8 +33,11 @@ def parse_data(data):
     return [Wrapper(eval(packet)) for packet in data.split()]
 
 
-def part1(data):
-    packets = parse_data(data)
+def prepare(data):
+    return parse_data(data)
+
+
+def part1(packets):
     pairs = zip(packets[::2], packets[1::2])
     return sum(
         idx
@@ -43,7 +46,7 @@ def part1(data):
     )
 
 
-def part2(data):
+def part2(packets):
     dividers = [Wrapper([[2]]), Wrapper([[6]])]
-    packets = sorted(parse_data(data) + dividers)
+    packets = sorted(packets + dividers)
     return (packets.index(dividers[0]) + 1) * (packets.index(dividers[1]) + 1)
@@ -1,77 +1,93 @@
-from collections import defaultdict
-from itertools import count, product
+from itertools import count
 
+from aoc.grid import Grid
 
-def parse_data(data):
-    rocks = set()
-    for line in data.split("\n"):
-        if not line:
-            continue
-
-        points = [
-            tuple(int(token) for token in pair.split(","))
-            for pair in line.strip().split(" -> ")
-        ]
 
-        for point_a, point_b in zip(points, points[1:]):
+def parse_data(data):
+    """Returns a grid of the cave with 1 for every rock, along with the depth of the lowest rock.
+    Row 0 of the grid is the top of the cave; the grid is just deep and wide enough to hold every
+    position that sand can reach, centered on the sand's source at x=500.
+    """
+    paths = [
+        [tuple(int(token) for token in pair.split(",")) for pair in line.split(" -> ")]
+        for line in data.strip().split("\n")
+    ]
+    rock_depth = max(depth for path in paths for _, depth in path)
+
+    # sand spreads out by at most one unit for every unit it falls, and never rests below the
+    # lowest rock + 1 (with one extra row for it to fall out of the bottom in part 1)
+    half_width = rock_depth + 2
+    grid = Grid((rock_depth + 3, 2 * half_width + 1))
+
+    for path in paths:
+        for point_a, point_b in zip(path, path[1:]):
             coords, depths = zip(point_a, point_b)
             start_coord, end_coord = sorted(coords)
             start_depth, end_depth = sorted(depths)
 
-            rocks.update(
-                product(
-                    range(start_coord, end_coord + 1), range(start_depth, end_depth + 1)
+            # rocks beyond the reach of the sand don't matter
+            start_coord = max(start_coord, 500 - half_width)
+            end_coord = min(end_coord, 500 + half_width)
+
+            for depth in range(start_depth, end_depth + 1):
+                row = grid.index((depth, 0)) + half_width - 500
+                grid.cells[row + start_coord : row + end_coord + 1] = bytes(
+                    [1] * max(end_coord - start_coord + 1, 0)
                 )
-            )
 
-    return rocks, max(depth for _, depth in rocks)
+    return grid, rock_depth
+
+
+def prepare(data):
+    return parse_data(data)
 
 
 def part1(data):
-    blocked, rock_depth = parse_data(data)
+    grid, rock_depth = data
+    blocked = bytearray(grid.cells)
+    width = grid.shape[1]
+    source = width // 2
 
     def next_position():
-        """Return the position of the next grain of sand by simulation, or
-        `None` if it falls off the map.
+        """Return the position (as a flat index) of the next grain of sand by
+        simulation, or `None` if it falls off the map.
         """
-        depth = 0
-        coord = 500
-        while depth <= rock_depth:
-            if (coord, depth + 1) not in blocked:
-                depth += 1
-            elif (coord - 1, depth + 1) not in blocked:
-                coord -= 1
-                depth += 1
-            elif (coord + 1, depth + 1) not in blocked:
-                coord += 1
-                depth += 1
+        position = source
+        for _ in range(rock_depth + 1):
+            below = position + width
+            if not blocked[below]:
+                position = below
+            elif not blocked[below - 1]:
+                position = below - 1
+            elif not blocked[below + 1]:
+                position = below + 1
             else:
-                return (coord, depth)
+                return position
 
     for i in count():
         position = next_position()
-        if not position:
+        if position is None:
             break
-        blocked.add(position)
+        blocked[position] = 1
 
     return i
 
 
 def part2(data):
-    rocks, rock_depth = parse_data(data)
-
-    # keys are depths, values are sets of coordinates occupied by sand
-    sand = defaultdict(set)
-    sand[0].add(500)
-
-    # iterate from the top, where each grain of sand at a depth spawns three
-    # directly beneath it, unless a position is blocked by rocks
-    for idx in range(0, rock_depth + 1):
-        for grain_coord in sand[idx]:
-            sand[idx + 1].update(
-                coord
-                for coord in range(grain_coord - 1, grain_coord + 2)
-                if (coord, idx + 1) not in rocks
-            )
-
-    return sum(len(grains) for grains in sand.values())
+    grid, rock_depth = data
+    width = grid.shape[1]
+
+    # each row of the grid is treated as a big integer with one byte per
+    # position, so that a whole row can be updated at once: every grain of
+    # sand spawns three directly beneath it (by shifting the row one position
+    # each way), unless a position is blocked by rocks
+    ones = int.from_bytes(b"\x01" * width, "big")
+    sand = 1 << 8 * (width // 2)
+    total = 1
+
+    for depth in range(1, rock_depth + 2):
+        rocks = int.from_bytes(grid.cells[depth * width : (depth + 1) * width], "big")
+        sand = (sand | sand << 8 | sand >> 8) & ones & ~rocks
+        total += sand.to_bytes(width, "big").count(1)
+
+    return total
@@ -1,11 +1,8 @@
-import re
+from aoc.parse import rows
 
 
 def parse_data(data):
-    for line in data.split("\n"):
-        if not line:
-            continue
-        x1, y1, x2, y2 = [int(token) for token in re.findall(r"-?\d+", line)]
+    for x1, y1, x2, y2 in rows(data, 4):
         yield (x1, y1), (x2, y2)
 
 
@@ -27,11 +24,15 @@ class Sensor:
         return (self.pos[0] - self.width(y), self.pos[0] + self.width(y))
 
 
+def prepare(data):
+    sensors, beacons = zip(*parse_data(data))
+    return [Sensor(*x) for x in zip(sensors, beacons)], beacons
+
+
 def part1(data):
     target = 2000000
 
-    sensors, beacons = zip(*parse_data(data))
-    sensors = [Sensor(*x) for x in zip(sensors, beacons)]
+    sensors, beacons = data
 
     covered = set()
     for sensor in sensors:
@@ -46,8 +47,7 @@ def part1(data):
 
 
 def part2(data):
-    sensors, beacons = zip(*parse_data(data))
-    sensors = [Sensor(*x) for x in zip(sensors, beacons)]
+    sensors, _ = data
 
     def gap(intervals):
         """Return the gap in the intervals, if present. Assumes only one such
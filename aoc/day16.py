@@ -2,6 +2,8 @@ from collections import defaultdict, deque
 from itertools import chain, combinations, product
 import re
 
+from aoc import metrics
+
 
 def parse_data(data):
     """Generate an unweighted graph structure from the input."""
@@ -61,8 +63,9 @@ def powerset(iterable):
     ]
 
 
-def run(data, time):
-    edges, nodes = consolidate(*parse_data(data))
+def run(graph, time):
+    edges, nodes = graph
+    record = metrics.recorder()
 
     # list of dict of dicts to represent the currently-determined maximum
     # possible pressure release:
@@ -85,6 +88,9 @@ def run(data, time):
     for minute, valve, open_valves in product(
         range(1, time + 1), nodes, powerset(nodes)
     ):
+        if record is not None:
+            record["states_expanded"] += 1
+
         # update with pressure released since the previous minute
         pressures[minute][valve][open_valves] = max(
             pressures[minute][valve][open_valves],
@@ -102,8 +108,13 @@ def run(data, time):
 
             # unreachable in the remaining time
             if minute + distance + 1 > time:
+                if record is not None:
+                    record["pruned_unreachable"] += 1
                 continue
 
+            if record is not None:
+                record["transitions"] += 1
+
             new_open_valves = frozenset(open_valves | {other_valve})
 
             # update with pressure released during travel to new valve
@@ -122,17 +133,21 @@ def run(data, time):
     }
 
 
-def part1(data):
-    return max(run(data, 30).values())
+def prepare(data):
+    return consolidate(*parse_data(data))
+
+
+def part1(graph):
+    return max(run(graph, 30).values())
 
 
-def part2(data):
+def part2(graph):
     # consider the sum of maximum pressures released for two paths which have
     # _disjoint_ sets of opened valves only
     return max(
         pressure1 + pressure2
         for (ov1, pressure1), (ov2, pressure2) in product(
-            run(data, 26).items(), repeat=2
+            run(graph, 26).items(), repeat=2
         )
         if ov1.isdisjoint(ov2)
     )
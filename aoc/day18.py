@@ -1,66 +1,29 @@
-from itertools import product
+from aoc.grid import Grid
+from aoc.parse import rows
 
 
 def parse_data(data):
-    return {tuple(int(x) for x in line.split(",")) for line in data.split()}
+    """Returns a grid with 1 for every lava voxel, padded by a layer of air all around."""
+    grid, _ = Grid.from_points(rows(data, 3), pad=1)
+    return grid
 
 
-def area(grid):
-    """Counts how many neighbors are empty space for each voxel in the grid."""
+def area(grid, exposed):
+    """Counts the faces of lava voxels which border a voxel in the `exposed` mask."""
+    return sum(
+        exposed[voxel + step] for voxel in grid.find(1) for step in grid.steps
+    )
 
-    def neighbor_empty(voxel, dim, dx):
-        voxel = list(voxel)
-        voxel[dim] += dx
-        return tuple(voxel) not in grid
 
-    return sum(neighbor_empty(*args) for args in product(grid, range(3), (-1, 1)))
+def prepare(data):
+    return parse_data(data)
 
 
-def part1(data):
-    return area(parse_data(data))
+def part1(grid):
+    return area(grid, grid.mask(0))
 
 
-def part2(data):
-    grid = parse_data(data)
-
-    def find_bounds(dim):
-        """Return lower and upper bounds of the grid for the given dimension, with 1 unit of
-        padding.
-        """
-        values = {voxel[dim] for voxel in grid}
-        return min(values) - 1, max(values) + 1
-
-    bounds = [find_bounds(dim) for dim in range(3)]
-
-    # DFS to find all "air-accessible" positions on the perimeter of the grid starting from an
-    # air-occupied corner of the bounding box
-    start = tuple(bound[0] for bound in bounds)
-    queue = [start]
-    accessible = {start}
-
-    while queue:
-        voxel = queue.pop()
-        for dim, dx in product(range(3), (-1, 1)):
-            test_voxel = list(voxel)
-            test_voxel[dim] += dx
-            test_voxel = tuple(test_voxel)
-            if (
-                # ensure neighbor is within bounds
-                not all(
-                    lower_bound <= pos <= upper_bound
-                    for pos, (lower_bound, upper_bound) in zip(test_voxel, bounds)
-                )
-                # and not in the grid or one we've already seen
-                or test_voxel in grid | accessible
-            ):
-                continue
-
-            queue.append(test_voxel)
-            accessible.add(test_voxel)
-
-    # construct a new "filled" grid by starting with a solid rectangular prism and subtracting out
-    # the "air-accessible" locations - this is equivalent to the starting grid with the closed
-    # cavities filled in
-    filled_grid = set(product(*[range(*bound) for bound in bounds])) - accessible
-
-    return area(filled_grid)
+def part2(grid):
+    # flood fill to find all "air-accessible" positions starting from a corner of the padding,
+    # which is always air - any air not reached this way is a closed cavity
+    return area(grid, grid.flood_fill(0, 0))
@@ -1,18 +1,17 @@
 from dataclasses import dataclass, field
 from functools import cache
-from re import findall
 
 from frozendict import frozendict
 
+from aoc import metrics
+from aoc.parse import rows
+
 
 RESOURCE_TYPES = ("ore", "clay", "obsidian", "geode")
 
 
 def parse_data(data):
-    def line_to_recipe(line):
-        _, ore_ore, clay_ore, obsidian_ore, obsidian_clay, geode_ore, geode_obsidian = [
-            int(x) for x in findall(r"\d+", line)
-        ]
+    def to_recipe(ore_ore, clay_ore, obsidian_ore, obsidian_clay, geode_ore, geode_obsidian):
         return {
             "ore": {"ore": ore_ore},
             "clay": {"ore": clay_ore},
@@ -20,11 +19,8 @@ def parse_data(data):
             "geode": {"ore": geode_ore, "obsidian": geode_obsidian},
         }
 
-    return {
-        idx: line_to_recipe(line)
-        for idx, line in enumerate(data.split("\n"), start=1)
-        if line
-    }
+    # each blueprint is its ID followed by six costs
+    return {idx: to_recipe(*costs) for idx, *costs in rows(data, 7, signed=False)}
 
 
 @dataclass(frozen=True)
@@ -84,6 +80,8 @@ def run(recipe, time):
     3. Don't construct a robot if the total production of that resource would exceed the maximum
        possible amount consumed in a single time step.
     """
+    record = metrics.recorder()
+
     # heuristic 1
     max_geode = 0
 
@@ -97,6 +95,9 @@ def run(recipe, time):
     def recurse(state):
         nonlocal max_geode
 
+        if record is not None:
+            record["nodes_expanded"] += 1
+
         if state.time == time:
             geode = state.generate().geode
 
@@ -114,6 +115,8 @@ def run(recipe, time):
             state.geode + dt * (dt - 1) // 2 + state.robots.get("geode", 0) * dt
             <= max_geode
         ):
+            if record is not None:
+                record["pruned_heuristic1"] += 1
             return 0  # the value here doesn't matter
 
         robot_plans = [dict()]
@@ -129,6 +132,8 @@ def run(recipe, time):
                 robot_type != "geode"
                 and state.robots.get(robot_type, 0) + 1 > max_resources[robot_type]
             ):
+                if record is not None:
+                    record["pruned_heuristic3"] += 1
                 continue
 
             plan = {"added_robots": {robot_type: 1}}
@@ -137,6 +142,8 @@ def run(recipe, time):
             # heuristic 2
             if robot_type == "geode":
                 # constructing a geode robot is our only plan
+                if record is not None:
+                    record["pruned_heuristic2"] += len(robot_plans)
                 robot_plans = [plan]
                 break
 
@@ -151,22 +158,33 @@ def run(recipe, time):
             for new_state in [state.spawn(**plan) for plan in reversed(robot_plans)]
         )
 
-    return recurse(State())
+    result = recurse(State())
+
+    # the cache is specific to this run, so its totals are all ours
+    if record is not None:
+        record["cache_hits"] += recurse.cache_info().hits
+        record["cache_misses"] += recurse.cache_info().misses
+
+    return result
+
+
+def prepare(data):
+    return parse_data(data)
 
 
-def part1(data):
+def part1(recipes):
     quality_sum = 0
 
-    for id_, recipe in parse_data(data).items():
+    for id_, recipe in recipes.items():
         quality_sum += run(recipe, 24) * id_
 
     return quality_sum
 
 
-def part2(data):
+def part2(recipes):
     prod = 1
 
-    for id_, recipe in parse_data(data).items():
+    for id_, recipe in recipes.items():
         if id_ > 3:
             break
 
@@ -1,3 +1,7 @@
+from collections import Counter
+import re
+
+
 ROCK = 1
 PAPER = 2
 SCISSORS = 3
@@ -13,40 +17,59 @@ GAME_RULES = {
     SCISSORS: {ROCK: WIN, PAPER: LOSE, SCISSORS: DRAW},
 }
 
+OPPONENT_TOKENS = {"A": ROCK, "B": PAPER, "C": SCISSORS}
 
-def part1(data):
-    token_map = {
-        "A": ROCK,
-        "B": PAPER,
-        "C": SCISSORS,
-        "X": ROCK,
-        "Y": PAPER,
-        "Z": SCISSORS,
+
+ROUND_PATTERN = re.compile(rb"[ABC] [XYZ]")
+
+
+def round_counts(data):
+    """Counts how many times each of the 9 possible rounds (e.g. "A Y") appears in the input,
+    which may be a string or any bytes-like buffer (bytes, bytearray, memoryview, mmap). Either
+    way every round is counted at C speed, so this is much faster than scoring the rounds one by
+    one.
+    """
+    if isinstance(data, (str, bytes, bytearray)):
+        # a count pass per kind of round is the fastest option, where it's available
+        counts = dict()
+        for token1 in OPPONENT_TOKENS:
+            for token2 in "XYZ":
+                pattern = f"{token1} {token2}"
+                if not isinstance(data, str):
+                    pattern = pattern.encode()
+                counts[token1, token2] = data.count(pattern)
+        return counts
+
+    # other buffers have no count method, but can be scanned by a bytes regex
+    return {
+        (chr(round_[0]), chr(round_[2])): count
+        for round_, count in Counter(ROUND_PATTERN.findall(data)).items()
     }
-    calls = [token_map[token] for token in data.split()]
+
+
+def total_score(data, token_map, score):
+    """Applies a score function of (opponent's call, second column's meaning) to each kind of
+    round, weighted by how often it appears.
+    """
     return sum(
-        call2 + GAME_RULES[call1][call2]
-        for call1, call2 in zip(calls[::2], calls[1::2])
+        count * score(OPPONENT_TOKENS[token1], token_map[token2])
+        for (token1, token2), count in round_counts(data).items()
     )
 
 
+def part1(data):
+    token_map = {"X": ROCK, "Y": PAPER, "Z": SCISSORS}
+    return total_score(data, token_map, lambda call1, call2: call2 + GAME_RULES[call1][call2])
+
+
 def part2(data):
-    token_map = {
-        "A": ROCK,
-        "B": PAPER,
-        "C": SCISSORS,
-        "X": LOSE,
-        "Y": DRAW,
-        "Z": WIN,
-    }
-    calls = [token_map[token] for token in data.split()]
+    token_map = {"X": LOSE, "Y": DRAW, "Z": WIN}
 
     reverse_rules = {
         key1: {value2: key2 for key2, value2 in value1.items()}
         for key1, value1 in GAME_RULES.items()
     }
 
-    return sum(
-        call2 + reverse_rules[call1][call2]
-        for call1, call2 in zip(calls[::2], calls[1::2])
+    return total_score(
+        data, token_map, lambda call1, call2: call2 + reverse_rules[call1][call2]
     )
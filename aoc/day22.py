@@ -106,7 +106,7 @@ class Board:
 
 
 def run(data, transitions):
-    walls, steps = parse_data(data)
+    walls, steps = data
 
     board = Board(walls, 50, transitions)
 
@@ -122,6 +122,10 @@ def run(data, transitions):
     return 1000 * (r + 1) + 4 * (c + 1) + facing
 
 
+def prepare(data):
+    return parse_data(data)
+
+
 def part1(data):
     # specific to user's input :(
     transitions = {
@@ -63,9 +63,7 @@ def timestep(elves, t):
     }
 
 
-def run(data, time=None):
-    elves = parse_data(data)
-
+def run(elves, time=None):
     for t in count():
         new_elves = timestep(elves, t)
         if new_elves == elves or (time and t == time - 1):
@@ -73,12 +71,16 @@ def run(data, time=None):
         elves = new_elves
 
 
-def part1(data):
-    elves, _ = run(data, 10)
+def prepare(data):
+    return parse_data(data)
+
+
+def part1(elves):
+    elves, _ = run(elves, 10)
     rows, cols = zip(*elves)
     return (max(rows) - min(rows) + 1) * (max(cols) - min(cols) + 1) - len(elves)
 
 
-def part2(data):
-    _, t = run(data)
+def part2(elves):
+    _, t = run(elves)
     return t
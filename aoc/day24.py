@@ -1,9 +1,11 @@
 from collections import defaultdict
 from heapq import heappop, heappush
-from itertools import product
 from functools import cache
 from math import lcm
 
+from aoc import metrics
+from aoc.grid import Grid
+
 
 def parse_data(data):
     dir_map = {">": (0, 1), "<": (0, -1), "^": (-1, 0), "v": (1, 0)}
@@ -24,14 +26,23 @@ def parse_data(data):
     return blizzards, height, width
 
 
-def run(data, n):
-    blizzards, height, width = parse_data(data)
-
-    # the blizzard pattern repeats this often
-    period = lcm(height, width)
-
-    start = (-1, 0)
-    target = (height, width - 1)
+def occupancy(blizzards, height, width):
+    """Builds the map as a grid, padded by a layer of wall all around, with 1
+    for every cell inside the valley (including the start and end positions,
+    which are outside the rectangle but still legal) and 0 for walls. Returns
+    the grid and a cached function giving the positions on the map which are
+    available to be moved into at a given time, as a mask over the grid. It's
+    built once per input so that every trek (and both parts) share the same
+    per-time-step cache.
+    """
+    grid = Grid((height + 4, width + 4))
+    stride = grid.shape[1]
+    for r in range(height):
+        row_start = grid.index((r + 2, 2))
+        grid.cells[row_start : row_start + width] = b"\x01" * width
+    start = grid.index((1, 2))
+    target = grid.index((height + 2, width + 1))
+    grid.cells[start] = grid.cells[target] = 1
 
     @cache
     def open_positions(t, rotated=False):
@@ -39,27 +50,41 @@ def run(data, n):
         The time parameter must be modulo the period - can't do that operation
         in this method because it would break the cache. If rotated is True,
         "rotate" the map by 180 degrees, so when we're backtracking, we can
-        simply treat the end as the start and vice versa.
+        simply treat the end as the start and vice versa. The padded map is
+        symmetric, so that's just the mask in reverse.
         """
         if rotated:
-            return {
-                (height - r - 1, width - c - 1) for r, c in open_positions(t, False)
-            }
+            return open_positions(t, False)[::-1]
 
-        # start with the full rectangle and subtract out positions occupied by
+        # start with the full map and clear out positions occupied by
         # blizzards
-        positions = set(product(range(height), range(width)))
+        positions = bytearray(grid.cells)
         for (dr, dc), dir_blizzards in blizzards.items():
-            positions -= {
-                ((r + dr * t) % height, (c + dc * t) % width) for r, c in dir_blizzards
-            }
-
-        # add in the start and end positions since they are outside the
-        # rectangle but still legal
-        positions |= {start, target}
+            for r, c in dir_blizzards:
+                positions[
+                    ((r + dr * t) % height + 2) * stride + (c + dc * t) % width + 2
+                ] = 0
 
         return positions
 
+    return grid, open_positions
+
+
+def run(valley, n):
+    height, width, grid, open_positions = valley
+    stride = grid.shape[1]
+    record = metrics.recorder()
+    if record is not None:
+        # the cache is shared with other runs, so only count this run's use of it
+        cache_before = open_positions.cache_info()
+
+    # the blizzard pattern repeats this often
+    period = lcm(height, width)
+
+    # positions are flat indices into the map grid
+    start = grid.index((1, 2))
+    target = len(grid) - 1 - start
+
     #######################
     ### A* pathfinding! ###
     ######################
@@ -87,6 +112,10 @@ def run(data, n):
 
     queue = {(start, 0, 0)}
     while queue:
+        if record is not None:
+            record["nodes_expanded"] += 1
+            metrics.high_water(record, "heap_high_water", len(f_scores))
+
         f_score, (pos, t, trek) = heappop(f_scores)
         queue.remove((pos, t, trek))
 
@@ -98,18 +127,14 @@ def run(data, n):
 
         # if we've reached the target, rotate back to the start and find
         # available neighboring spots from there
-        r, c = start if pos == target else pos
+        site = start if pos == target else pos
 
         next_t = (t + 1) % period
+        available = open_positions(next_t, bool(next_trek % 2))
 
-        for next_pos in {
-            (r, c),
-            (r + 1, c),
-            (r - 1, c),
-            (r, c + 1),
-            (r, c - 1),
-        } & open_positions(next_t, bool(next_trek % 2)):
-            next_r, next_c = next_pos
+        for next_pos in (site, site + 1, site - 1, site + stride, site - stride):
+            if not available[next_pos]:
+                continue
 
             # if this is a new fastest path to the neighboring spot, update the
             # g-score of this 4D point, calculate its f-score (estimated
@@ -121,8 +146,8 @@ def run(data, n):
                     f_scores,
                     (
                         trial_g_score
-                        - next_r  # Manhattan distance
-                        - next_c
+                        - next_pos // stride  # Manhattan distance
+                        - next_pos % stride
                         - height * width * next_trek,  # trek adjustment
                         (next_pos, next_t, next_trek),
                     ),
@@ -130,13 +155,23 @@ def run(data, n):
                 g_scores[next_pos, next_t, next_trek] = trial_g_score
                 queue.add((next_pos, next_t, next_trek))
 
+    if record is not None:
+        metrics.record_cache(
+            record, "occupancy_cache", cache_before, open_positions.cache_info()
+        )
+
     # the real cost of the final 4D point
     return g_scores[pos, t, trek]
 
 
-def part1(data):
-    return run(data, 1)
+def prepare(data):
+    blizzards, height, width = parse_data(data)
+    return (height, width, *occupancy(blizzards, height, width))
+
+
+def part1(valley):
+    return run(valley, 1)
 
 
-def part2(data):
-    return run(data, 3)
+def part2(valley):
+    return run(valley, 3)
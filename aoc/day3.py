@@ -3,16 +3,39 @@ from operator import and_
 from string import ascii_lowercase, ascii_uppercase
 
 
+# objects from highest to lowest priority, so that as a binary number each object's bit is at
+# position priority - 1
+OBJECTS = (ascii_lowercase + ascii_uppercase)[::-1].encode()
+CLEAR_BITS = bytes.maketrans(OBJECTS, b"0" * len(OBJECTS))
+
+
+def object_mask(collection):
+    """Converts a collection of objects to a 52-bit mask of which objects it holds. Rather than
+    setting bits one object at a time, the objects are mapped to "1" in a translation table, which
+    turns the list of all objects into the mask's binary digits without any Python-level loop.
+    """
+    if isinstance(collection, str):
+        collection = collection.encode()
+    present = bytes.maketrans(collection, b"1" * len(collection))
+    return int(OBJECTS.translate(present).translate(CLEAR_BITS), 2)
+
+
 def shared_object_value(*collections):
     """Gets the "value" of the object shared between all collections. Assumes exactly one such
-    object exists.
+    object exists, so the intersection of their masks has a single bit set, whose position is the
+    object's priority.
     """
-    sets = [set(collection) for collection in collections]
-    shared_obj = reduce(and_, sets).pop()
+    return reduce(and_, map(object_mask, collections)).bit_length()
 
-    if shared_obj in ascii_lowercase:
-        return ascii_lowercase.index(shared_obj) + 1
-    return ascii_uppercase.index(shared_obj) + 27
+
+def group_values(rucksacks, size=3):
+    """Generates the value of the object shared within each consecutive group of `size` rucksacks,
+    from any iterable of rucksacks (e.g. the lines of an open file). Groups are consumed as they
+    go, so streams of any length can be processed in constant memory.
+    """
+    masks = (object_mask(rucksack.strip()) for rucksack in rucksacks)
+    for group in zip(*[masks] * size):
+        yield reduce(and_, group).bit_length()
 
 
 def part1(data):
@@ -25,8 +48,4 @@ def part1(data):
 
 
 def part2(data):
-    rucksacks = data.split()
-    return sum(
-        shared_object_value(*rucksacks[3 * i : 3 * (i + 1)])
-        for i in range(len(rucksacks) // 3)
-    )
+    return sum(group_values(data.split()))
@@ -1,22 +1,73 @@
-def parse_ranges(ranges):
-    for range_ in ranges:
-        if not range_:
-            continue
-        range1, range2 = range_.split(",")
-        range1 = [int(x) for x in range1.split("-")]
-        range2 = [int(x) for x in range2.split("-")]
-        yield range1, range2
-
-
-def part1(data):
-    return sum(
-        start1 <= start2 and end1 >= end2 or start2 <= start1 and end2 >= end1
-        for (start1, end1), (start2, end2) in parse_ranges(data.split("\n"))
-    )
-
-
-def part2(data):
-    return sum(
-        end1 >= start2 and end2 >= start1
-        for (start1, end1), (start2, end2) in parse_ranges(data.split("\n"))
-    )
+from bisect import bisect_left, bisect_right
+from itertools import compress
+from operator import and_, ge, le, or_
+
+from aoc.parse import int_array
+
+
+def parse_columns(data):
+    """Parses the input into four int32 columns: the first elf's start and end sections, then the
+    second elf's.
+    """
+    values = int_array(data, signed=False, typecode="i")
+    if len(values) % 4:
+        raise ValueError(f"{len(values)} sections can't be split into pairs of ranges")
+    return tuple(values[column::4] for column in range(4))
+
+
+def contained(columns):
+    """Flags, for every pair, whether one range fully contains the other. Every comparison is done
+    column-wise with `map` over C-level operators rather than one pair at a time in Python.
+    """
+    start1, end1, start2, end2 = columns
+    first_contains = map(and_, map(le, start1, start2), map(ge, end1, end2))
+    second_contains = map(and_, map(le, start2, start1), map(ge, end2, end1))
+    return map(or_, first_contains, second_contains)
+
+
+def overlapping(columns):
+    """Flags, for every pair, whether the two ranges overlap."""
+    start1, end1, start2, end2 = columns
+    return map(and_, map(ge, end1, start2), map(ge, end2, start1))
+
+
+class OverlapIndex:
+    """Answers "how many pairs share a section within [start, end]?" for any number of queries
+    without rescanning the assignments.
+
+    Only the sections shared by a pair matter, and they form a single range (the intersection of
+    its two ranges). That range misses the query only if it ends before `start` or begins after
+    `end`, and never both, so each query is two binary searches over the sorted intersection
+    endpoints.
+    """
+
+    def __init__(self, columns):
+        start1, end1, start2, end2 = columns
+        starts = list(map(max, start1, start2))
+        ends = list(map(min, end1, end2))
+        shared = list(map(le, starts, ends))
+        self.starts = sorted(compress(starts, shared))
+        self.ends = sorted(compress(ends, shared))
+
+    def __len__(self):
+        """The number of pairs which overlap at all."""
+        return len(self.starts)
+
+    def count(self, start, end):
+        if start > end:
+            raise ValueError(f"Invalid section range [{start}, {end}]")
+        ends_before = bisect_left(self.ends, start)
+        starts_after = len(self.starts) - bisect_right(self.starts, end)
+        return len(self) - ends_before - starts_after
+
+
+def prepare(data):
+    return parse_columns(data)
+
+
+def part1(columns):
+    return sum(contained(columns))
+
+
+def part2(columns):
+    return sum(overlapping(columns))
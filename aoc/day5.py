@@ -1,4 +1,4 @@
-import re
+from aoc.parse import rows
 
 
 def parse_stacks(stack_data):
@@ -13,36 +13,47 @@ def parse_stacks(stack_data):
     return [list(reversed(stack)) for stack in stacks]
 
 
-def run(data, move_func):
+def trace_tops(stacks, moves, one_at_a_time):
+    """Finds the boxes on top of each stack after all the moves without ever moving a box.
+
+    Only the stack heights are followed forwards. Then each final top position (a stack and a
+    depth below its top) is followed backwards through the moves to the position it started at,
+    so the cost is proportional to the number of moves times the number of stacks, however many
+    boxes each move carries.
+    """
+    heights = [len(stack) for stack in stacks]
+    for n, from_idx, to_idx in moves:
+        heights[from_idx] -= n
+        heights[to_idx] += n
+
+    positions = [(idx, 0) for idx, height in enumerate(heights) if height]
+    for n, from_idx, to_idx in reversed(moves):
+        for pos_idx, (stack, depth) in enumerate(positions):
+            if stack == from_idx:
+                # the moved boxes were on top of it
+                positions[pos_idx] = stack, depth + n
+            elif stack == to_idx:
+                if depth >= n:
+                    positions[pos_idx] = stack, depth - n
+                elif one_at_a_time:
+                    # moving boxes one at a time reverses their order
+                    positions[pos_idx] = from_idx, n - 1 - depth
+                else:
+                    positions[pos_idx] = from_idx, depth
+
+    return "".join(stacks[stack][-1 - depth] for stack, depth in positions)
+
+
+def run(data, one_at_a_time):
     stack_data, moves = data.split("\n\n")
     stacks = parse_stacks(stack_data.split("\n"))
-
-    for move in moves.split("\n"):
-        if not move:
-            continue
-
-        match = re.match(r"move (\d+) from (\d+) to (\d+)", move)
-        n, from_, to = match.groups()
-        n = int(n)
-        from_idx = int(from_) - 1
-        to_idx = int(to) - 1
-
-        move_func(stacks, n, from_idx, to_idx)
-
-    return "".join(stack[-1] for stack in stacks)
+    moves = [(n, from_ - 1, to - 1) for n, from_, to in rows(moves, 3, signed=False)]
+    return trace_tops(stacks, moves, one_at_a_time)
 
 
 def part1(data):
-    def move_func(stacks, n, from_idx, to_idx):
-        for _ in range(n):
-            stacks[to_idx].append(stacks[from_idx].pop())
-
-    return run(data, move_func)
+    return run(data, one_at_a_time=True)
 
 
 def part2(data):
-    def move_func(stacks, n, from_idx, to_idx):
-        stacks[to_idx].extend(stacks[from_idx][-n:])
-        stacks[from_idx] = stacks[from_idx][:-n]
-
-    return run(data, move_func)
+    return run(data, one_at_a_time=False)
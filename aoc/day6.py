@@ -1,10 +1,43 @@
 from itertools import count
 
 
+CHUNK_SIZE = 64 * 1024
+
+
+def chunks(source, size=CHUNK_SIZE):
+    """Generates the signal in pieces. It may be a string or bytes, or anything with a `read`
+    method (an open file or an mmap), which is read `size` characters at a time.
+    """
+    if isinstance(source, (str, bytes, bytearray)):
+        yield source
+        return
+    while chunk := source.read(size):
+        yield chunk
+
+
+def markers(source, n):
+    """Generates the position just after every window of `n` distinct characters, in order.
+
+    The last index each character was seen at is kept, along with where the current run of
+    distinct characters started. A repeat moves the start to just after its previous occurrence,
+    so each character is looked at once whatever the window size.
+    """
+    last_seen = dict()
+    start = 0
+    positions = count()
+    for chunk in chunks(source):
+        # the chunk goes first so that zip stops without consuming an extra position
+        for char, pos in zip(chunk, positions):
+            previous = last_seen.get(char, -1)
+            if previous >= start:
+                start = previous + 1
+            last_seen[char] = pos
+            if pos - start + 1 >= n:
+                yield pos + 1
+
+
 def run(data, n):
-    for i in count(start=n):
-        if len(set(data[i - n : i])) == n:
-            return i
+    return next(markers(data, n), None)
 
 
 def part1(data):
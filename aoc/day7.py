@@ -1,8 +1,14 @@
 class Node:
+    """A file or directory. Directory sizes are filled in once the whole tree is built, by
+    `compute_sizes`.
+    """
+
+    __slots__ = ("parent", "dir", "size", "children")
+
     def __init__(self, parent, dir_, size=None):
         self.parent = parent
         self.dir = dir_
-        self._size = size
+        self.size = size
         if dir_:
             self.children = dict()
 
@@ -11,12 +17,6 @@ class Node:
             child = Node(self, True) if info == "dir" else Node(self, False, int(info))
             self.children[filename] = child
 
-    @property
-    def size(self):
-        if self.dir:
-            return sum(child.size for child in self.children.values())
-        return self._size
-
 
 class DataIterator:
     """Processes the data and allows for "peeking" at the next line without consuming it."""
@@ -61,6 +61,7 @@ def build_tree(data):
             while iterator.next is not None and not iterator.next.startswith("$"):
                 ls_data.append(next(iterator))
             current_node.process_ls(ls_data)
+    compute_sizes(root)
     return root
 
 
@@ -73,15 +74,66 @@ def get_dirs(root):
         yield node
 
 
-def part1(data):
-    root = build_tree(data)
+def compute_sizes(root):
+    # every directory comes before its subdirectories in get_dirs, so in reverse each directory's
+    # children are all sized before it is
+    for dir_ in reversed(list(get_dirs(root))):
+        dir_.size = sum(child.size for child in dir_.children.values())
 
-    return sum(dir_.size for dir_ in get_dirs(root) if dir_.size <= 100000)
 
+def dir_sizes(lines):
+    """Totals the size of every directory straight from the transcript, without building a tree.
+    `lines` may be the whole transcript as a string, or any iterable of its lines (e.g. an open
+    file), so transcripts of any length can be streamed.
+
+    Returns the total sizes keyed by path, as a tuple of directory names (`()` is the root).
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+
+    own_sizes = {(): 0}
+    listed = set()
+    path = ()
+    listing = False
+    for line in lines:
+        if line.startswith("$ cd"):
+            target = line[5:].strip()
+            if target == "/":
+                path = ()
+            elif target == "..":
+                path = path[:-1]
+            else:
+                path += (target,)
+                own_sizes.setdefault(path, 0)
+            listing = False
+        elif line.startswith("$ ls"):
+            # listing a directory again mustn't count its files twice
+            listing = path not in listed
+            listed.add(path)
+        elif listing:
+            info, _, name = line.strip().partition(" ")
+            if info == "dir":
+                own_sizes.setdefault(path + (name,), 0)
+            elif info:
+                own_sizes[path] += int(info)
+
+    # add each directory's total to its parent's, deepest first
+    sizes = dict(own_sizes)
+    for path in sorted(own_sizes, key=len, reverse=True):
+        if path:
+            sizes[path[:-1]] += sizes[path]
+    return sizes
+
+
+def prepare(data):
+    return build_tree(data)
+
+
+def part1(root):
+    return sum(dir_.size for dir_ in get_dirs(root) if dir_.size <= 100000)
 
-def part2(data):
-    root = build_tree(data)
 
+def part2(root):
     return min(
         dir_.size for dir_ in get_dirs(root) if dir_.size >= root.size - 40000000
     )
@@ -1,84 +1,65 @@
-from collections import defaultdict
+from array import array
+from itertools import accumulate
+from operator import gt, mul, or_
 
+from aoc.grid import Grid
 
-def parse_data(data):
-    return [[int(x) for x in row.strip()] for row in data.split()]
-
-
-def apply_by_direction(data, func, initial_value):
-    """Applies a function to the data in all four directions, collecting the results in an
-    accumulator dictionary with a given initial value.
-    """
-    accumulator = defaultdict(lambda: initial_value)
-
-    for row_idx, row in enumerate(data):
-        # left to right
-        func(row, accumulator, lambda col_idx: (row_idx, col_idx))
-
-        # right to left
-        func(
-            reversed(row),
-            accumulator,
-            lambda col_idx: (row_idx, len(row) - col_idx - 1),
-        )
-
-    for col_idx, col in enumerate(
-        [row[i] for row in data] for i in range(len(data[0]))
-    ):
-        # up to down
-        func(col, accumulator, lambda row_idx: (row_idx, col_idx))
-
-        # down to up
-        func(
-            reversed(col),
-            accumulator,
-            lambda row_idx: (len(col) - row_idx - 1, col_idx),
-        )
-
-    return accumulator
 
+HEIGHTS = bytes.maketrans(b"0123456789", bytes(range(10)))
 
-def part1(data):
-    data = parse_data(data)
-
-    def mark_visible(seq, visible, key_func):
-        max_ = -1
-
-        for idx, tree in enumerate(seq):
-            # a tree is visible if it's taller than any other tree already encountered in this
-            # direction
-            visible[key_func(idx)] |= tree > max_
-
-            max_ = max(max_, tree)
-
-    is_visible = apply_by_direction(data, mark_visible, False)
-
-    return sum(is_visible.values())
 
+def parse_data(data):
+    return Grid.from_text(data, HEIGHTS)
 
-def part2(data):
-    data = parse_data(data)
 
-    def multiply_visibility(seq, visible_product, key_func):
+def lines_of_sight(grid):
+    """Generates slices of the grid's flat cells for every row and column, in both directions, each
+    running from an edge tree inwards.
+    """
+    height, width = grid.shape
+    for row in range(height):
+        start, end = row * width, (row + 1) * width
+        yield slice(start, end)
+        yield slice(end - 1, start - 1 if start else None, -1)
+    for col in range(width):
+        yield slice(col, None, width)
+        yield slice(col + (height - 1) * width, col - 1 if col else None, -width)
+
+
+def viewing_distances(trees):
+    """How far each tree in a line can see back towards the start of the line. A stack holds the
+    positions of the trees which could still block a later tree's view (each is taller than any
+    tree after it), so every tree is pushed and popped at most once.
+    """
+    blockers = list()
+    distances = list()
+    for idx, tree in enumerate(trees):
+        while blockers and trees[blockers[-1]] < tree:
+            blockers.pop()
         # trees on edges can't see any trees in this direction
-        visible_product[key_func(0)] *= 0
+        distances.append(idx - blockers[-1] if blockers else idx)
+        blockers.append(idx)
+    return distances
 
-        idx_by_height = {idx: 0 for idx in range(10)}
 
-        for idx, tree in enumerate(seq):
-            # don't care about the edge trees
-            if not idx:
-                continue
+def prepare(data):
+    return parse_data(data)
 
-            # multiply in the number of trees visible in this direction from
-            # this tree
-            visible_product[key_func(idx)] *= idx - idx_by_height[tree]
 
-            # update the index of the most recent tree of at most a given
-            # height in this direction
-            for height in range(tree + 1):
-                idx_by_height[height] = idx
+def part1(grid):
+    visible = bytearray(len(grid))
+    for line in lines_of_sight(grid):
+        trees = grid.cells[line]
+        # a tree is visible if it's taller than any other tree already encountered in this
+        # direction
+        tallest_before = accumulate(trees, max, initial=-1)
+        visible[line] = bytes(map(or_, visible[line], map(gt, trees, tallest_before)))
+    return sum(visible)
 
-    visible_trees = apply_by_direction(data, multiply_visibility, 1)
 
-    return max(visible_trees.values())
+def part2(grid):
+    scores = array("q", [1]) * len(grid)
+    for line in lines_of_sight(grid):
+        distances = viewing_distances(grid.cells[line])
+        scores[line] = array("q", map(mul, scores[line], distances))
+    return max(scores)
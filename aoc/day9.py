@@ -1,53 +1,77 @@
 DIRS = {"R": (1, 0), "L": (-1, 0), "U": (0, 1), "D": (0, -1)}
 
 
-def steps_from_data(data):
+def moves_from_data(data):
+    """Parses each move as a direction and a number of steps, leaving the steps unexpanded."""
     tokens = data.split()
-    for dir_, steps in zip(tokens[::2], tokens[1::2]):
-        for _ in range(int(steps)):
-            yield DIRS[dir_]
-
-
-def steps_from_steps(steps):
-    head = tail = (0, 0)
-    visited = {tail}
-    new_steps = list()
-
-    for dx, dy in steps:
-        # move the head knot
-        head = (head[0] + dx, head[1] + dy)
-
-        # calculate the x and y distance from the tail knot
-        x_diff = head[0] - tail[0]
-        y_diff = head[1] - tail[1]
-
-        # if within 1 in both dimensions, the tail knot doesn't move
-        if abs(x_diff) <= 1 and abs(y_diff) <= 1:
-            continue
-
-        # in either dimension, if the head knot is at a different position, the
-        # tail moves 1 step towards it. the funny math just returns the "sign"
-        # of the difference in position: +1, 0, or -1
-        tail_dx = x_diff // (abs(x_diff) or 1)  # avoid division by 0
-        tail_dy = y_diff // (abs(y_diff) or 1)
-
-        tail = (tail[0] + tail_dx, tail[1] + tail_dy)
-        visited.add(tail)
-        new_steps.append((tail_dx, tail_dy))
-
-    return new_steps, len(visited)
+    return [(*DIRS[dir_], int(steps)) for dir_, steps in zip(tokens[::2], tokens[1::2])]
+
+
+def head_span(moves):
+    """How far apart the lowest and highest x the head reaches are. Every other knot stays within
+    that range too.
+    """
+    x = min_x = max_x = 0
+    for dx, _, steps in moves:
+        x += dx * steps
+        min_x, max_x = min(min_x, x), max(max_x, x)
+    return max_x - min_x
+
+
+def follow_steps(width):
+    """Maps every possible offset from a knot to the knot ahead of it (as a difference of flat
+    indices in a grid `width` wide) to the step the knot takes, which is 0 if they're touching.
+    Offsets are at most 2 in either dimension, so with a width of at least 5 each is unique.
+    """
+    steps = dict()
+    for dy in range(-2, 3):
+        for dx in range(-2, 3):
+            touching = abs(dx) <= 1 and abs(dy) <= 1
+            # otherwise the knot moves 1 step towards the knot ahead in either dimension where
+            # they're at a different position
+            step_x = (dx > 0) - (dx < 0)
+            step_y = (dy > 0) - (dy < 0)
+            steps[dx + dy * width] = 0 if touching else step_x + step_y * width
+    return steps
+
+
+def simulate(data, n_knots):
+    """Moves all the knots together, one step of the head at a time, and returns how many cells each
+    knot visited (indexed from the head at 0).
+
+    Positions are packed into single ints as `x + y * width`, with a width wider than the range
+    of x the knots can cover (so no two cells share a packed position) and enough for
+    `follow_steps`. Each knot adds the cells it visits to its own set, so memory follows the number
+    of cells actually visited rather than the area the rope moves over.
+    """
+    moves = moves_from_data(data)
+    width = head_span(moves) + 5
+    follow = follow_steps(width)
+
+    knots = [0] * n_knots
+    visited = [{0} for _ in range(n_knots)]
+    head_visited = visited[0]
+
+    for dx, dy, steps in moves:
+        head_step = dx + dy * width
+        for _ in range(steps):
+            head = knots[0] = knots[0] + head_step
+            head_visited.add(head)
+
+            leader = head
+            for knot in range(1, n_knots):
+                step = follow[leader - knots[knot]]
+                # if this knot doesn't move, neither do any of the knots following it
+                if not step:
+                    break
+                leader = knots[knot] = knots[knot] + step
+                visited[knot].add(leader)
+
+    return [len(knot_visited) for knot_visited in visited]
 
 
 def run(data, n_following):
-    # steps for the head knot comes from input data
-    steps = steps_from_data(data)
-
-    # the movement (steps) of following knots is generated from the movement of
-    # the leading knot. repeat the generation of steps for every remaining knot
-    # in the chain
-    for _ in range(n_following):
-        steps, n_visited = steps_from_steps(steps)
-    return n_visited
+    return simulate(data, n_following + 1)[-1]
 
 
 def part1(data):
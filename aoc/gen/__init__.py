@@ -0,0 +1,10 @@
+from importlib import import_module
+import random
+
+
+def generate(day, size, seed=0):
+    """Generates a valid input for a day. What `size` controls differs by day (e.g. the number of
+    motions for day 9 or the number of sensors for day 15) and is described by each day's
+    `generate` function; either way, the input grows with it.
+    """
+    return import_module(f"aoc.gen.day{day}").generate(size, random.Random(seed))
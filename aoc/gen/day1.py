@@ -0,0 +1,6 @@
+def generate(size, rng):
+    """`size` is the number of elves."""
+    return "\n\n".join(
+        "\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+        for _ in range(size)
+    ) + "\n"
@@ -0,0 +1,6 @@
+def generate(size, rng):
+    """`size` is the number of instructions."""
+    return "".join(
+        "noop\n" if rng.random() < 0.3 else f"addx {rng.randint(-20, 20)}\n"
+        for _ in range(size)
+    )
@@ -0,0 +1,34 @@
+DIVISORS = (2, 3, 5, 7, 11, 13, 17, 19)
+
+
+def generate(size, rng):
+    """`size` is the total number of items, spread over eight monkeys."""
+    n_monkeys = len(DIVISORS)
+    items = [[rng.randint(50, 99)] for _ in range(n_monkeys)]
+    for _ in range(max(size - n_monkeys, 0)):
+        items[rng.randrange(n_monkeys)].append(rng.randint(50, 99))
+
+    divisors = list(DIVISORS)
+    rng.shuffle(divisors)
+    square = rng.randrange(n_monkeys)
+
+    monkeys = list()
+    for idx, divisor in enumerate(divisors):
+        if idx == square:
+            operation = "old * old"
+        elif rng.random() < 0.3:
+            operation = f"old * {rng.randint(2, 19)}"
+        else:
+            operation = f"old + {rng.randint(1, 8)}"
+        throw_true, throw_false = rng.sample(
+            [other for other in range(n_monkeys) if other != idx], 2
+        )
+        monkeys.append(
+            f"Monkey {idx}:\n"
+            f"  Starting items: {', '.join(str(item) for item in items[idx])}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {divisor}\n"
+            f"    If true: throw to monkey {throw_true}\n"
+            f"    If false: throw to monkey {throw_false}\n"
+        )
+    return "\n".join(monkeys)
@@ -0,0 +1,26 @@
+from string import ascii_lowercase
+
+
+def generate(size, rng):
+    """`size` is the number of rows; the map is twice as wide as it is tall (and at least 26
+    columns, so that it can climb all the way up to `z`).
+    """
+    rows, cols = size, max(2 * size, 26)
+    start = (rng.randrange(rows), 0)
+    end = (rng.randrange(rows), cols - 1)
+
+    lines = list()
+    for r in range(rows):
+        line = list()
+        for c in range(cols):
+            if (r, c) == start:
+                line.append("S")
+            elif (r, c) == end:
+                line.append("E")
+            elif 0 < c < cols - 2 and rng.random() < 0.05:
+                # occasional pits; they never disconnect the gently sloping terrain
+                line.append("a")
+            else:
+                line.append(ascii_lowercase[min(25, c * 26 // cols + (r // 3) % 2)])
+        lines.append("".join(line))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,13 @@
+def packet(rng, depth=0):
+    items = list()
+    for _ in range(rng.randint(0, 4)):
+        if depth < 3 and rng.random() < 0.3:
+            items.append(packet(rng, depth + 1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return "[" + ",".join(items) + "]"
+
+
+def generate(size, rng):
+    """`size` is the number of packet pairs."""
+    return "\n".join(f"{packet(rng)}\n{packet(rng)}\n" for _ in range(size))
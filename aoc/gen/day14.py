@@ -0,0 +1,14 @@
+def generate(size, rng):
+    """`size` is the number of rock paths."""
+    lines = list()
+    for _ in range(size):
+        x, y = rng.randint(440, 560), rng.randint(10, 160)
+        points = [(x, y)]
+        for step in range(rng.randint(1, 4)):
+            if step % 2:
+                y = min(max(y + rng.randint(-6, 6), 10), 160)
+            else:
+                x = min(max(x + rng.randint(-6, 6), 440), 560)
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return "\n".join(lines) + "\n"
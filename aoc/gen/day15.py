@@ -0,0 +1,22 @@
+LIMIT = 4000000
+SPREAD = 1000000
+
+
+def generate(size, rng):
+    """`size` is the number of sensors. Each sensor's range stops just short of a hidden distress
+    beacon, so the beacon is never covered.
+    """
+    hidden = (rng.randint(0, LIMIT), rng.randint(0, LIMIT))
+    lines = list()
+    for _ in range(size):
+        # keep sensors in the neighbourhood of the beacon, like real inputs
+        sx = min(max(hidden[0] + rng.randint(-SPREAD, SPREAD), 0), LIMIT)
+        sy = min(max(hidden[1] + rng.randint(-SPREAD, SPREAD), 0), LIMIT)
+        distance = abs(sx - hidden[0]) + abs(sy - hidden[1]) - 1
+        dx = rng.randint(0, distance)
+        bx = sx + rng.choice((-1, 1)) * dx
+        by = sy + rng.choice((-1, 1)) * (distance - dx)
+        lines.append(
+            f"Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}"
+        )
+    return "\n".join(lines) + "\n"
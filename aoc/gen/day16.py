@@ -0,0 +1,33 @@
+from itertools import product
+from string import ascii_uppercase
+
+
+def generate(size, rng, working=7):
+    """`size` is the number of valves, at most `working` of which have a non-zero flow rate."""
+    names = ["".join(pair) for pair in product(ascii_uppercase, repeat=2)]
+    names.remove("AA")
+    names = ["AA"] + rng.sample(names, size - 1)
+
+    tunnels = {name: set() for name in names}
+    for idx in range(1, size):
+        other = names[rng.randrange(idx)]
+        tunnels[names[idx]].add(other)
+        tunnels[other].add(names[idx])
+    for _ in range(size // 4):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    rates = dict.fromkeys(names, 0)
+    for name in rng.sample(names[1:], min(working, size - 1)):
+        rates[name] = rng.randint(1, 25)
+
+    lines = list()
+    for name in names:
+        neighbors = sorted(tunnels[name])
+        if len(neighbors) == 1:
+            lead = f"tunnel leads to valve {neighbors[0]}"
+        else:
+            lead = f"tunnels lead to valves {', '.join(neighbors)}"
+        lines.append(f"Valve {name} has flow rate={rates[name]}; {lead}")
+    return "\n".join(lines) + "\n"
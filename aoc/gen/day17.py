@@ -0,0 +1,3 @@
+def generate(size, rng):
+    """`size` is the length of the jet pattern."""
+    return "".join(rng.choices("<>", k=size)) + "\n"
@@ -0,0 +1,8 @@
+def generate(size, rng):
+    """`size` is the (maximum) number of cubes, packed into a box sized to be about half full."""
+    side = max(round((2 * size) ** (1 / 3)), 2)
+    cubes = {
+        (rng.randint(1, side), rng.randint(1, side), rng.randint(1, side))
+        for _ in range(size)
+    }
+    return "".join(f"{x},{y},{z}\n" for x, y, z in cubes)
@@ -0,0 +1,10 @@
+def generate(size, rng):
+    """`size` is the number of blueprints."""
+    return "".join(
+        f"Blueprint {idx}: "
+        f"Each ore robot costs {rng.randint(2, 4)} ore. "
+        f"Each clay robot costs {rng.randint(2, 4)} ore. "
+        f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. "
+        f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} obsidian.\n"
+        for idx in range(1, size + 1)
+    )
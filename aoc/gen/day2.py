@@ -0,0 +1,3 @@
+def generate(size, rng):
+    """`size` is the number of rounds."""
+    return "".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(size))
@@ -0,0 +1,5 @@
+def generate(size, rng):
+    """`size` is the number of values in the encrypted file; exactly one of them is zero."""
+    values = [rng.choice((-1, 1)) * rng.randint(1, 10000) for _ in range(size - 1)]
+    values.insert(rng.randint(0, size - 1), 0)
+    return "".join(f"{value}\n" for value in values)
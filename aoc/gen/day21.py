@@ -0,0 +1,64 @@
+from string import ascii_lowercase
+
+
+def monkey_name(idx):
+    chars = list()
+    for _ in range(4):
+        idx, char = divmod(idx, 26)
+        chars.append(ascii_lowercase[char])
+    return "".join(chars)
+
+
+def generate(size, rng):
+    """`size` is the number of number-yelling monkeys (leaves of the expression tree). Every
+    division is exact and the two halves of `root` yell the same number, so part 2's answer is the
+    value `humn` yells in part 1.
+    """
+    names = [monkey_name(idx) for idx in rng.sample(range(26**4), 2 * size + 4)]
+    names = [name for name in names if name not in ("root", "humn")]
+    lines = list()
+
+    def build(n_leaves, humn=False):
+        """Emits a subtree with the given number of leaves, returning its name and value."""
+        if n_leaves == 1:
+            name = "humn" if humn else names.pop()
+            value = rng.randint(1, 20)
+            lines.append(f"{name}: {value}")
+            return name, value
+
+        # keep the tree roughly balanced so that it stays shallow
+        n_left = rng.randint(max(n_leaves // 4, 1), max(3 * n_leaves // 4, 1))
+        humn_left = rng.random() < 0.5
+        left, left_value = build(n_left, humn and humn_left)
+        right, right_value = build(n_leaves - n_left, humn and not humn_left)
+
+        ops = ["+", "-"]
+        if left_value and right_value and abs(left_value * right_value) < 10**12:
+            ops.append("*")
+        if right_value and not left_value % right_value:
+            ops.append("/")
+        op = rng.choice(ops)
+        value = {
+            "+": lambda: left_value + right_value,
+            "-": lambda: left_value - right_value,
+            "*": lambda: left_value * right_value,
+            "/": lambda: left_value // right_value,
+        }[op]()
+
+        name = names.pop()
+        lines.append(f"{name}: {left} {op} {right}")
+        return name, value
+
+    n_humn = max(size // 2, 1)
+    humn_side, humn_value = build(n_humn, humn=True)
+    other_side, other_value = build(max(size - n_humn - 1, 1))
+
+    # balance the two sides of the root
+    balance, balanced = names.pop(), names.pop()
+    diff = humn_value - other_value
+    lines.append(f"{balance}: {abs(diff)}")
+    lines.append(f"{balanced}: {other_side} {'+' if diff >= 0 else '-'} {balance}")
+    lines.append(f"root: {humn_side} + {balanced}")
+
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,26 @@
+DIM = 50
+
+# sectors of the cube net that the solver expects, as indices into a 4x3 grid of faces
+SECTORS = (1, 2, 4, 6, 7, 9)
+
+
+def generate(size, rng):
+    """`size` is the number of path instructions. The board always has the cube net layout and
+    50-tile faces that the solver expects.
+    """
+    lines = list()
+    for r in range(4 * DIM):
+        line = list()
+        for c in range(3 * DIM):
+            if 3 * (r // DIM) + c // DIM not in SECTORS:
+                line.append(" ")
+            elif (r, c) != (0, DIM) and rng.random() < 0.05:
+                line.append("#")
+            else:
+                line.append(".")
+        lines.append("".join(line).rstrip())
+
+    path = "".join(
+        f"{rng.randint(1, 50)}{rng.choice('LR')}" for _ in range(size - 1)
+    ) + str(rng.randint(1, 50))
+    return "\n".join(lines) + "\n\n" + path + "\n"
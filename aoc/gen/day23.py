@@ -0,0 +1,6 @@
+def generate(size, rng):
+    """`size` is the side length of the (square) starting region, about half full of elves."""
+    return "".join(
+        "".join("#" if rng.random() < 0.5 else "." for _ in range(size)) + "\n"
+        for _ in range(size)
+    )
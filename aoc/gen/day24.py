@@ -0,0 +1,14 @@
+def generate(size, rng):
+    """`size` is the width of the valley, which is a third as tall. As in real inputs, the entrance
+    and exit columns have no vertical blizzards.
+    """
+    width, height = max(size, 3), max(size // 3, 2)
+    lines = ["#." + "#" * width]
+    for _ in range(height):
+        row = list()
+        for c in range(width):
+            choices = "<>^v" if 0 < c < width - 1 else "<>"
+            row.append(rng.choice(choices) if rng.random() < 0.3 else ".")
+        lines.append("#" + "".join(row) + "#")
+    lines.append("#" * width + ".#")
+    return "\n".join(lines) + "\n"
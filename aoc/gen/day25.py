@@ -0,0 +1,6 @@
+from aoc.day25 import encode
+
+
+def generate(size, rng):
+    """`size` is the number of SNAFU numbers."""
+    return "".join(f"{encode(rng.randint(1, 10**12))}\n" for _ in range(size))
@@ -0,0 +1,28 @@
+from string import ascii_letters
+
+
+def rucksack(badge, pool_a, pool_b, rng):
+    """Builds a rucksack whose compartments share exactly one item type, holding the badge and
+    otherwise only items from the two given pools.
+    """
+    shared = rng.choice(pool_a + [badge])
+    first = [shared, badge] + rng.choices(pool_a, k=rng.randint(4, 14))
+    second = [shared] + rng.choices(pool_b, k=len(first) - 1)
+    rng.shuffle(first)
+    rng.shuffle(second)
+    return "".join(first + second)
+
+
+def generate(size, rng):
+    """`size` is the number of elf groups (three rucksacks each)."""
+    lines = list()
+    for _ in range(size):
+        letters = list(ascii_letters)
+        rng.shuffle(letters)
+        badge, rest = letters[0], letters[1:]
+        pools = [rest[i * 17 : (i + 1) * 17] for i in range(3)]
+        for idx in range(3):
+            # each item type other than the badge appears in at most two rucksacks of the group
+            pool = pools[(idx + 1) % 3] + pools[(idx + 2) % 3]
+            lines.append(rucksack(badge, pool[:17], pool[17:], rng))
+    return "\n".join(lines) + "\n"
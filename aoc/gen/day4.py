@@ -0,0 +1,8 @@
+def section_range(rng):
+    start = rng.randint(1, 99)
+    return f"{start}-{rng.randint(start, 99)}"
+
+
+def generate(size, rng):
+    """`size` is the number of elf pairs."""
+    return "".join(f"{section_range(rng)},{section_range(rng)}\n" for _ in range(size))
@@ -0,0 +1,29 @@
+from string import ascii_uppercase
+
+
+def generate(size, rng, n_stacks=9):
+    """`size` is the number of moves in the rearrangement procedure."""
+    stacks = [rng.choices(ascii_uppercase, k=rng.randint(1, 8)) for _ in range(n_stacks)]
+    height = max(len(stack) for stack in stacks)
+
+    drawing = list()
+    for level in reversed(range(height)):
+        drawing.append(
+            " ".join(f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks)
+        )
+    drawing.append(" ".join(f" {idx} " for idx in range(1, n_stacks + 1)))
+
+    # every stack keeps at least one crate so that the tops are always defined
+    heights = [len(stack) for stack in stacks]
+    moves = list()
+    for _ in range(size):
+        from_idx = rng.choice([idx for idx, h in enumerate(heights) if h > 1] or [0])
+        to_idx = rng.choice([idx for idx in range(n_stacks) if idx != from_idx])
+        n = rng.randint(1, heights[from_idx] - 1) if heights[from_idx] > 1 else 0
+        if not n:
+            continue
+        heights[from_idx] -= n
+        heights[to_idx] += n
+        moves.append(f"move {n} from {from_idx + 1} to {to_idx + 1}")
+
+    return "\n".join(drawing) + "\n\n" + "\n".join(moves) + "\n"
@@ -0,0 +1,9 @@
+from string import ascii_lowercase
+
+
+def generate(size, rng):
+    """`size` is the length of the signal. The start-of-message marker sits at the end of the
+    signal: before it, the signal only uses 13 distinct characters.
+    """
+    body = "".join(rng.choices(ascii_lowercase[:13], k=max(size - 14, 4)))
+    return body + "".join(rng.sample(ascii_lowercase, 14)) + "\n"
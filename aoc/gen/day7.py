@@ -0,0 +1,23 @@
+def generate(size, rng):
+    """`size` is the number of directories."""
+    children = {0: list()}
+    for idx in range(1, size):
+        children[idx] = list()
+        children[rng.randrange(idx)].append(idx)
+
+    lines = list()
+
+    def visit(idx):
+        lines.append("$ ls")
+        for child in children[idx]:
+            lines.append(f"dir d{child}")
+        for file_idx in range(rng.randint(0, 5)):
+            lines.append(f"{rng.randint(1, 300000)} f{file_idx}.txt")
+        for child in children[idx]:
+            lines.append(f"$ cd d{child}")
+            visit(child)
+            lines.append("$ cd ..")
+
+    lines.append("$ cd /")
+    visit(0)
+    return "\n".join(lines) + "\n"
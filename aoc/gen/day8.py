@@ -0,0 +1,5 @@
+def generate(size, rng):
+    """`size` is the side length of the (square) forest."""
+    return "".join(
+        "".join(rng.choices("0123456789", k=size)) + "\n" for _ in range(size)
+    )
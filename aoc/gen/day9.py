@@ -0,0 +1,3 @@
+def generate(size, rng):
+    """`size` is the number of head motions."""
+    return "".join(f"{rng.choice('RLUD')} {rng.randint(1, 20)}\n" for _ in range(size))
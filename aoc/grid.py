@@ -0,0 +1,114 @@
+from collections import deque
+from math import prod
+
+
+class Grid:
+    """A dense 2D or 3D grid stored as a flat bytearray (one byte per cell) in row-major order,
+    rather than as a set of coordinate tuples.
+
+    Cells can be addressed by coordinate tuples, but the fast paths work on flat indices: the
+    orthogonal neighbors of a cell are at `idx + step` for each step in `steps`. That's only valid
+    away from the edges, so grids are usually padded with a border of cells which can never be
+    entered, which removes the need for bounds checks in hot loops.
+    """
+
+    def __init__(self, shape, fill=0):
+        self.shape = tuple(shape)
+        self.strides = tuple(prod(self.shape[dim + 1 :]) for dim in range(len(self.shape)))
+        self.cells = bytearray([fill]) * prod(self.shape)
+
+    @classmethod
+    def from_text(cls, text, table=None):
+        """Parses a rectangular block of text into a 2D grid of its characters' byte values,
+        optionally mapped through a `bytes.maketrans` table.
+        """
+        rows = text.split()
+        grid = cls((len(rows), len(rows[0])))
+        cells = "".join(rows).encode()
+        grid.cells[:] = cells.translate(table) if table else cells
+        return grid
+
+    @classmethod
+    def from_points(cls, points, pad=1, value=1):
+        """Builds a grid just large enough to hold the given points (plus `pad` cells of padding
+        on every side), with those points set to `value`. Returns the grid and the coordinates of
+        its origin, which are subtracted from a point to get its position in the grid.
+        """
+        points = list(points)
+        lower = [min(coords) - pad for coords in zip(*points)]
+        upper = [max(coords) + pad for coords in zip(*points)]
+        grid = cls(high - low + 1 for low, high in zip(lower, upper))
+        for point in points:
+            grid[tuple(coord - low for coord, low in zip(point, lower))] = value
+        return grid, tuple(lower)
+
+    def index(self, coords):
+        return sum(coord * stride for coord, stride in zip(coords, self.strides))
+
+    def coords(self, idx):
+        return tuple((idx // stride) % size for stride, size in zip(self.strides, self.shape))
+
+    def __getitem__(self, coords):
+        return self.cells[self.index(coords)]
+
+    def __setitem__(self, coords, value):
+        self.cells[self.index(coords)] = value
+
+    def __len__(self):
+        return len(self.cells)
+
+    @property
+    def steps(self):
+        """Flat index offsets of the orthogonal neighbors of a cell."""
+        return tuple(sign * stride for stride in self.strides for sign in (-1, 1))
+
+    def neighbors(self, idx):
+        """Flat indices of the orthogonal neighbors of a cell which are inside the grid. Padded
+        grids can skip the bounds checks by using `steps` directly.
+        """
+        for stride, size in zip(self.strides, self.shape):
+            coord = (idx // stride) % size
+            if coord > 0:
+                yield idx - stride
+            if coord < size - 1:
+                yield idx + stride
+
+    def padded(self, pad=1, fill=0):
+        """Returns a copy of the grid with `pad` cells of `fill` added on every side."""
+        grid = Grid((size + 2 * pad for size in self.shape), fill)
+        offset = grid.index([pad] * len(self.shape))
+        # copy over the grid one innermost row at a time
+        width = self.shape[-1]
+        for start in range(0, len(self.cells), width):
+            target = offset + grid.index(self.coords(start))
+            grid.cells[target : target + width] = self.cells[start : start + width]
+        return grid
+
+    def mask(self, *values):
+        """Returns a bytearray holding 1 for every cell with one of the given values, else 0."""
+        table = bytearray(256)
+        for value in values:
+            table[value] = 1
+        return self.cells.translate(table)
+
+    def find(self, value):
+        """Generates the flat indices of every cell holding the given value."""
+        idx = self.cells.find(value)
+        while idx != -1:
+            yield idx
+            idx = self.cells.find(value, idx + 1)
+
+    def flood_fill(self, start, *passable):
+        """Returns a mask of every cell reachable from `start` (a flat index) by moving between
+        orthogonally adjacent cells holding one of the `passable` values.
+        """
+        passable = self.mask(*passable)
+        reached = bytearray(len(self.cells))
+        reached[start] = 1
+        queue = deque([start])
+        while queue:
+            for neighbor in self.neighbors(queue.popleft()):
+                if passable[neighbor] and not reached[neighbor]:
+                    reached[neighbor] = 1
+                    queue.append(neighbor)
+        return reached
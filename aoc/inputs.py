@@ -0,0 +1,150 @@
+from hashlib import sha256
+import os
+from pathlib import Path
+import tempfile
+import time
+
+
+YEAR = 2022
+INPUT_URL = "{base_url}/{year}/day/{day}/input"
+
+
+class MissingSessionError(Exception):
+    pass
+
+
+def base_url():
+    """The site to download inputs from, overridable so that a local stand-in server can be used."""
+    return os.environ.get("AOC_BASE_URL", "https://adventofcode.com").rstrip("/")
+
+
+def cache_dir():
+    if "AOC_CACHE_DIR" in os.environ:
+        return Path(os.environ["AOC_CACHE_DIR"])
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "aoc"
+
+
+def session_token():
+    """The adventofcode.com session cookie, which is needed to download inputs."""
+    try:
+        return os.environ["AOC_SESSION"]
+    except KeyError:
+        raise MissingSessionError(
+            "AOC_SESSION is not set, so inputs can't be downloaded; "
+            "use --offline or --input to run from local files"
+        ) from None
+
+
+def session_hash(session):
+    # the session token is a credential, so only a digest of it ends up on disk
+    return sha256(session.encode()).hexdigest()[:16]
+
+
+def cache_path(day, session):
+    return cache_dir() / "inputs" / str(YEAR) / f"day{day}-{session_hash(session)}.txt"
+
+
+def find_cached(day, session=None):
+    """Returns the path of a cached input for the given day, or `None` if there isn't one. Without
+    a session, the most recently cached input for any session is used.
+    """
+    if session:
+        path = cache_path(day, session)
+        return path if path.exists() else None
+
+    candidates = sorted(
+        (cache_dir() / "inputs" / str(YEAR)).glob(f"day{day}-*.txt"),
+        key=lambda path: path.stat().st_mtime,
+    )
+    return candidates[-1] if candidates else None
+
+
+def write_atomic(path, text):
+    """Writes to a temporary file alongside the target and renames it into place, so that readers
+    never see a partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", newline="") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def download_input(day, session, http=None):
+    """Downloads an input, optionally through a `requests.Session` to reuse its connections."""
+    # requests is slow to import and most runs are served from the cache
+    import requests
+
+    response = (http or requests).get(
+        INPUT_URL.format(base_url=base_url(), year=YEAR, day=day),
+        cookies={"session": session},
+    )
+    response.raise_for_status()
+    return response.text
+
+
+def get_input(day, offline=False):
+    """Returns the input for the given day, downloading and caching it if it hasn't been seen
+    before. In offline mode, only the cache is consulted.
+    """
+    session = os.environ.get("AOC_SESSION")
+    path = find_cached(day, session)
+    if path:
+        with open(path, newline="") as f:
+            return f.read()
+
+    if offline:
+        raise FileNotFoundError(f"No cached input for day {day}")
+
+    session = session_token()
+    data = download_input(day, session)
+    write_atomic(cache_path(day, session), data)
+    return data
+
+
+def is_retryable(error):
+    """Connection problems, rate limiting and server errors are worth retrying; other client
+    errors (e.g. a puzzle that isn't unlocked yet) aren't.
+    """
+    response = getattr(error, "response", None)
+    return response is None or response.status_code == 429 or response.status_code >= 500
+
+
+def fetch_inputs(days, concurrency=4, retries=3, backoff=1.0):
+    """Downloads and caches the inputs for any of the given days that aren't cached yet, a few at
+    a time over a single pooled session. Failed downloads are retried with exponential backoff.
+    Returns the days fetched and a mapping of day to error for any that failed.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+
+    session = session_token()
+    missing = [day for day in days if not find_cached(day, session)]
+
+    def fetch(day):
+        for attempt in range(retries + 1):
+            try:
+                write_atomic(cache_path(day, session), download_input(day, session, http))
+                return None
+            except requests.RequestException as e:
+                if attempt == retries or not is_retryable(e):
+                    return e
+                time.sleep(backoff * 2**attempt)
+
+    with requests.Session() as http:
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=concurrency)
+        http.mount("http://", adapter)
+        http.mount("https://", adapter)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            errors = dict(zip(missing, executor.map(fetch, missing)))
+
+    return (
+        [day for day in missing if errors[day] is None],
+        {day: error for day, error in errors.items() if error is not None},
+    )
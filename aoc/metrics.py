@@ -0,0 +1,34 @@
+from collections import Counter
+
+
+# off by default; solvers fetch a recorder once per call and guard their hot loops with a cheap
+# local check, so there's nothing to pay when metrics are disabled
+enabled = False
+counters = Counter()
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def reset():
+    counters.clear()
+
+
+def recorder():
+    """Returns the counters to record into if metrics are enabled, otherwise `None`."""
+    return counters if enabled else None
+
+
+def high_water(metrics, name, value):
+    if value > metrics[name]:
+        metrics[name] = value
+
+
+def record_cache(metrics, prefix, before, after):
+    """Records the hits and misses of a `functools.cache`d function between two `cache_info()`
+    snapshots.
+    """
+    metrics[f"{prefix}_hits"] += after.hits - before.hits
+    metrics[f"{prefix}_misses"] += after.misses - before.misses
@@ -0,0 +1,34 @@
+from array import array
+import re
+
+
+PATTERNS = {
+    (str, True): re.compile(r"-?\d+"),
+    (str, False): re.compile(r"\d+"),
+    (bytes, True): re.compile(rb"-?\d+"),
+    (bytes, False): re.compile(rb"\d+"),
+}
+
+
+def ints(buffer, signed=True):
+    """Extracts every integer from a whole buffer in a single pass. The buffer may be a str or
+    anything bytes-like (bytes, bytearray, mmap). With `signed=False`, a `-` is never treated as a
+    sign, which matters for inputs like `2-4,6-8` where it's a separator.
+    """
+    pattern = PATTERNS[str if isinstance(buffer, str) else bytes, signed]
+    return list(map(int, pattern.findall(buffer)))
+
+
+def rows(buffer, width, signed=True):
+    """Extracts every integer from a buffer, grouped into tuples of `width` values (e.g. one per
+    line of an input with a fixed number of integers per line).
+    """
+    values = ints(buffer, signed)
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers can't be split into rows of {width}")
+    return list(zip(*[iter(values)] * width))
+
+
+def int_array(buffer, signed=True, typecode="q"):
+    """Extracts every integer from a buffer into a compact `array.array`."""
+    return array(typecode, ints(buffer, signed))
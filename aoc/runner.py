@@ -0,0 +1,77 @@
+from functools import partial
+from importlib import import_module
+import time
+
+
+PARTS = ("part1", "part2")
+
+
+def load_day(day):
+    return import_module(f"aoc.day{day}")
+
+
+def prepare(module, data):
+    """Runs a day's optional `prepare` stage, which turns the raw input into whatever both parts
+    take as their argument. Days without one are handed the raw input.
+    """
+    if hasattr(module, "prepare"):
+        return module.prepare(data)
+    return data
+
+
+def solve_part(day, part, data):
+    """Solves one part of a day from the raw input, returning the answer and the time it took
+    (including preparation). This is the unit of work sent to worker processes, so it only takes
+    picklable arguments; each worker prepares its own copy of the input.
+    """
+    module = load_day(day)
+    start = time.perf_counter()
+    answer = getattr(module, part)(prepare(module, data))
+    return answer, time.perf_counter() - start
+
+
+def run_parallel(inputs, workers=None):
+    """Solves every part of every day in `inputs` (a mapping of day to input) in a process pool,
+    so that slow parts overlap. Yields (day, part, answer, elapsed) tuples in day and part order,
+    each as soon as it and everything before it has finished.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    tasks = [
+        (day, part) for day in inputs for part in PARTS if hasattr(load_day(day), part)
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(solve_part, day, part, inputs[day]) for day, part in tasks
+        ]
+        for (day, part), future in zip(tasks, futures):
+            yield (day, part, *future.result())
+
+
+def solve_file(day, path):
+    """Solves every part of a day for the input in a file, returning a JSON-friendly record.
+    Failures are captured in the record rather than raised, so that one bad input doesn't take
+    down a whole batch.
+    """
+    record = {"input": str(path)}
+    try:
+        module = load_day(day)
+        with open(path, newline="") as f:
+            data = prepare(module, f.read())
+        for part in PARTS:
+            if hasattr(module, part):
+                record[part] = getattr(module, part)(data)
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    return record
+
+
+def run_batch(day, paths, workers=None, chunksize=16):
+    """Solves a day for every input file in `paths` in a process pool, dispatching the files to
+    workers in chunks to keep the per-task overhead down. Yields records in the order of `paths`.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(partial(solve_file, day), paths, chunksize=chunksize)